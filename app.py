@@ -4802,6 +4802,9 @@ def api_email_send():
     if not athlete_email:
         athlete_email = ENV_ATHLETE_EMAIL.lower().strip()
 
+    # Set once sending starts, so the finally below can write its EmailLog rows
+    response_tracker = None
+
     try:
         sheet = get_sheet()
         if not sheet:
@@ -5221,6 +5224,11 @@ def api_email_send():
     except Exception as e:
         logger.error(f"Email send error: {e}")
         return jsonify({'success': False, 'error': str(e), 'sent': 0, 'errors': 0})
+    finally:
+        # Write the EmailLog rows queued by record_sent, even if the batch
+        # (or smtp.quit()) failed part-way - those emails still went out
+        if response_tracker is not None:
+            response_tracker.flush()
 
 
 @app.route('/api/twitter/mark-dm-sent', methods=['POST'])
@@ -15,19 +15,100 @@ Version: 1.0.0
 ============================================================================
 """
 
+import atexit
+import base64
+import binascii
 import json
 import imaplib
 import email
-from email.header import decode_header
+from email.header import decode_header, make_header
+from email.parser import BytesHeaderParser
+from email.utils import parseaddr
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Bytes of each reply body fetched for the snippet. Decoding never makes a
+# body longer, so this also bounds the text the snippet is cut from.
+SNIPPET_SCAN_BYTES = 512
+
+# Only the headers we read plus enough MIME headers to decode the first
+# SNIPPET_SCAN_BYTES of the body. Content-Type/Transfer-Encoding let the
+# email parser find the text/plain part of a multipart reply.
+_FETCH_ITEMS = (
+    '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE CONTENT-TYPE CONTENT-TRANSFER-ENCODING)] '
+    f'BODY.PEEK[TEXT]<0.{SNIPPET_SCAN_BYTES}>)'
+)
+_FETCH_START_RE = re.compile(rb'^\d+ \(')
+
+_WS_RE = re.compile(r'\s+')
+# One RFC 2047 encoded-word: =?charset?B|Q?text?= (anchored pieces, no .*? scans)
+_RFC2047_RE = re.compile(r'=\?([^?]+)\?([BbQq])\?([^?]*)\?=')
+_HEADER_PARSER = BytesHeaderParser()
+_PLAIN_ENCODINGS = frozenset(('', '7bit', '8bit', 'binary'))
+
+# Coaches per OR-chained SEARCH; keeps commands well under server line limits
+SEARCH_BATCH_SIZE = 64
+
+# Hot-lead priority by division; smaller programs answer more often
+DIVISION_LEAD_SCORES = {'NAIA': 30, 'JUCO': 30, 'D3': 25, 'D2': 20, 'FCS': 15, 'FBS': 10}
+
+# Marks SentEmail.sent_at as not yet parsed
+_UNPARSED = object()
+
+# Sent-email rows buffered before one append_rows call
+APPEND_BATCH_SIZE = 50
+# Longest a queued row waits for the batch to fill before it is written anyway
+APPEND_FLUSH_SECONDS = 30
+
+# Concurrent IMAP sessions per check; Gmail allows 15 per account
+MAX_IMAP_CONNECTIONS = 4
+
+
+def _decode_mime_header(value) -> str:
+    """
+    Decode the RFC 2047 encoded-words in a header value.
+    
+    Plain headers are returned untouched; anything the fast path cannot
+    handle falls back to email.header.
+    """
+    if not value:
+        return ''
+    if isinstance(value, str):
+        if '=?' not in value:
+            return value
+        try:
+            parts = []
+            pos = 0
+            for match in _RFC2047_RE.finditer(value):
+                gap = value[pos:match.start()]
+                # Whitespace between two encoded-words is not part of the text
+                if gap and not (pos and gap.isspace()):
+                    parts.append(gap)
+                charset, encoding, text = match.groups()
+                if encoding in 'Bb':
+                    raw = base64.b64decode(text + '=' * (-len(text) % 4))
+                else:
+                    raw = binascii.a2b_qp(text.encode('ascii'), header=True)
+                parts.append(raw.decode(charset.split('*')[0], errors='replace'))
+                pos = match.end()
+            parts.append(value[pos:])
+            return ''.join(parts)
+        except (LookupError, ValueError, UnicodeError):
+            pass
+    try:
+        return str(make_header(decode_header(value)))
+    except Exception:
+        return str(value)
+
 
 @dataclass
 class SentEmail:
@@ -39,10 +120,61 @@ class SentEmail:
     coach_type: str  # rc, ol
     template_id: str
     followup_number: int  # 0 = initial, 1+ = follow-up
-    sent_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    sent_at: Optional[str] = None  # set by record_sent; rows loaded from Sheets carry their own
+    # Normalized coach_email used for all lookups and comparisons
+    coach_email_key: str = field(init=False, repr=False, compare=False)
+    _sent_at_dt: Optional[datetime] = field(default=_UNPARSED, init=False,
+                                            repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.coach_email_key = self.coach_email.lower().strip()
+    
+    @classmethod
+    def from_sheet_row(cls, row: List[str]) -> 'SentEmail':
+        """
+        Build from an EmailLog row (at least 8 columns).
+        
+        Fills __dict__ directly, skipping the generated __init__; used for
+        bulk loads where the per-call argument binding adds up.
+        """
+        obj = cls.__new__(cls)
+        obj.__dict__.update(
+            coach_email=row[0],
+            coach_name=row[1],
+            school=row[2],
+            division=row[3],
+            coach_type=row[4],
+            template_id=row[5],
+            followup_number=int(row[6]) if row[6] else 0,
+            sent_at=row[7],
+            coach_email_key=row[0].lower().strip(),
+            _sent_at_dt=_UNPARSED,
+        )
+        return obj
+    
+    @property
+    def sent_at_dt(self) -> Optional[datetime]:
+        """sent_at as a naive datetime, parsed on first use; None if unparseable."""
+        if self._sent_at_dt is _UNPARSED:
+            try:
+                parsed = datetime.fromisoformat(self.sent_at.replace('Z', '+00:00'))
+                self._sent_at_dt = parsed.replace(tzinfo=None)
+            except (AttributeError, TypeError, ValueError):
+                self._sent_at_dt = None
+        return self._sent_at_dt
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat record; spelled out rather than asdict() to skip its deep copy
+        return {
+            'coach_email': self.coach_email,
+            'coach_name': self.coach_name,
+            'school': self.school,
+            'division': self.division,
+            'coach_type': self.coach_type,
+            'template_id': self.template_id,
+            'followup_number': self.followup_number,
+            'sent_at': self.sent_at,
+        }
 
 
 @dataclass 
@@ -54,9 +186,37 @@ class Response:
     subject: str
     snippet: str  # First ~100 chars of body
     received_at: str
+    # Normalized coach_email used for all lookups and comparisons
+    coach_email_key: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.coach_email_key = self.coach_email.lower().strip()
+    
+    @classmethod
+    def from_sheet_row(cls, row: List[str]) -> 'Response':
+        """Build from a responded EmailLog row, skipping the generated __init__."""
+        obj = cls.__new__(cls)
+        obj.__dict__.update(
+            coach_email=row[0],
+            coach_name=row[1],
+            school=row[2],
+            subject='',
+            snippet='',
+            received_at=row[9] if len(row) > 9 else '',
+            coach_email_key=row[0].lower().strip(),
+        )
+        return obj
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat record; spelled out rather than asdict() to skip its deep copy
+        return {
+            'coach_email': self.coach_email,
+            'coach_name': self.coach_name,
+            'school': self.school,
+            'subject': self.subject,
+            'snippet': self.snippet,
+            'received_at': self.received_at,
+        }
 
 
 class GmailResponseChecker:
@@ -66,6 +226,8 @@ class GmailResponseChecker:
         self.email = email_address
         self.password = app_password
         self.imap = None
+        # time.monotonic() when last returned to the pool
+        self.last_used = 0.0
     
     def connect(self) -> bool:
         """Connect to Gmail IMAP."""
@@ -75,6 +237,13 @@ class GmailResponseChecker:
             return True
         except Exception as e:
             logger.error(f"IMAP connection failed: {e}")
+            # Never keep (or pool) a socket that did not get through LOGIN
+            if self.imap:
+                try:
+                    self.imap.shutdown()
+                except Exception:
+                    pass
+                self.imap = None
             return False
     
     def disconnect(self):
@@ -100,48 +269,118 @@ class GmailResponseChecker:
         since_date = (datetime.now() - timedelta(days=since_days)).strftime("%d-%b-%Y")
         
         try:
-            self.imap.select('INBOX')
+            try:
+                self.imap.select('INBOX')
+            except (imaplib.IMAP4.error, OSError):
+                # Pooled session went stale while idle; start a fresh one
+                self.disconnect()
+                if not self.connect():
+                    return []
+                self.imap.select('INBOX')
             
-            for coach_email in coach_emails:
-                # Search for emails from this address
-                search_criteria = f'(FROM "{coach_email}" SINCE {since_date})'
+            # Map the lowercased sender back to the address we were given
+            by_address = {e.lower().strip(): e for e in coach_emails}
+            addresses = list(by_address)
+            
+            for start in range(0, len(addresses), SEARCH_BATCH_SIZE):
+                batch = addresses[start:start + SEARCH_BATCH_SIZE]
+                # One SEARCH per batch of coaches instead of one per coach
+                search_criteria = f'(SINCE {since_date} {self._build_from_criteria(batch)})'
                 
                 try:
                     _, message_ids = self.imap.search(None, search_criteria)
+                    msg_ids = message_ids[0].split()
+                    if not msg_ids:
+                        continue
+                    
+                    # One FETCH for every hit instead of a round trip per message.
+                    # BODY.PEEK leaves \Seen alone; the body is capped at SNIPPET_SCAN_BYTES
+                    # since we only ever keep a short snippet.
+                    _, msg_data = self.imap.fetch(b','.join(msg_ids), _FETCH_ITEMS)
                     
-                    for msg_id in message_ids[0].split():
-                        _, msg_data = self.imap.fetch(msg_id, '(RFC822)')
+                    for header_bytes, body_bytes in self._group_fetch_parts(msg_data):
+                        # Headers only; no MIME tree is built unless the body needs one
+                        msg = _HEADER_PARSER.parsebytes(header_bytes)
+                        
+                        # IMAP FROM is a substring match, so confirm the sender
+                        sender = parseaddr(msg['From'] or '')[1].lower()
+                        coach_email = by_address.get(sender)
+                        if not coach_email:
+                            continue
+                        
+                        # Get subject
+                        subject = _decode_mime_header(msg['Subject'])
                         
-                        for part in msg_data:
-                            if isinstance(part, tuple):
-                                msg = email.message_from_bytes(part[1])
-                                
-                                # Get subject
-                                subject = decode_header(msg['Subject'])[0][0]
-                                if isinstance(subject, bytes):
-                                    subject = subject.decode('utf-8', errors='ignore')
-                                
-                                # Get date
-                                date_str = msg['Date']
-                                
-                                # Get snippet
-                                snippet = self._get_email_snippet(msg)
-                                
-                                responses.append({
-                                    'coach_email': coach_email,
-                                    'subject': subject or '',
-                                    'snippet': snippet,
-                                    'date': date_str
-                                })
+                        # Get date
+                        date_str = msg['Date']
+                        
+                        # Get snippet
+                        snippet = self._get_body_snippet(msg, header_bytes, body_bytes)
+                        
+                        responses.append({
+                            'coach_email': coach_email,
+                            'subject': subject or '',
+                            'snippet': snippet,
+                            'date': date_str
+                        })
+                except imaplib.IMAP4.abort:
+                    raise
                 except Exception as e:
-                    logger.warning(f"Error checking {coach_email}: {e}")
+                    logger.warning(f"Error checking {len(batch)} coaches: {e}")
                     continue
                     
+        except imaplib.IMAP4.abort as e:
+            # Connection is unusable; drop it so it is not returned to the pool
+            logger.error(f"IMAP connection lost: {e}")
+            self.disconnect()
         except Exception as e:
+            # Session state is unknown after a failed SELECT/SEARCH; drop it
+            # rather than hand it back to the pool
             logger.error(f"IMAP search error: {e}")
+            self.disconnect()
         
         return responses
     
+    @staticmethod
+    def _build_from_criteria(addresses: List[str]) -> str:
+        """Build a prefix-notation OR chain: OR OR FROM "a" FROM "b" FROM "c"."""
+        clauses = ' '.join(f'FROM "{address}"' for address in addresses)
+        return 'OR ' * (len(addresses) - 1) + clauses
+    
+    @staticmethod
+    def _group_fetch_parts(msg_data) -> List[Tuple[bytes, bytes]]:
+        """
+        Regroup a multi-message FETCH response into (header, body) pairs.
+        
+        imaplib returns one tuple per literal; the first literal of each
+        message starts with its sequence number, the rest continue it.
+        """
+        messages = []
+        for part in msg_data:
+            if not isinstance(part, tuple):
+                continue
+            prefix, data = part
+            if _FETCH_START_RE.match(prefix) or not messages:
+                messages.append([b'', b''])
+            if b'HEADER' in prefix.upper():
+                messages[-1][0] = data
+            else:
+                messages[-1][1] = data
+        return [(header, body) for header, body in messages]
+    
+    def _get_body_snippet(self, headers, header_bytes: bytes, body_bytes: bytes,
+                          max_length: int = 150) -> str:
+        """
+        Snippet from a fetched body section.
+        
+        Plain single-part bodies are used as-is; multipart or transfer-encoded
+        bodies go through the full email parser to locate and decode the text.
+        """
+        encoding = (headers['Content-Transfer-Encoding'] or '').strip().lower()
+        if headers.get_content_maintype() != 'multipart' and encoding in _PLAIN_ENCODINGS:
+            return self._snippet_from_payload(body_bytes, max_length) if body_bytes else ''
+        return self._get_email_snippet(email.message_from_bytes(header_bytes + body_bytes), max_length)
+    
     def _get_email_snippet(self, msg, max_length: int = 150) -> str:
         """Extract text snippet from email."""
         try:
@@ -150,19 +389,107 @@ class GmailResponseChecker:
                     if part.get_content_type() == 'text/plain':
                         payload = part.get_payload(decode=True)
                         if payload:
-                            text = payload.decode('utf-8', errors='ignore')
-                            # Clean up
-                            text = re.sub(r'\s+', ' ', text).strip()
-                            return text[:max_length] + ('...' if len(text) > max_length else '')
+                            return self._snippet_from_payload(payload, max_length)
             else:
                 payload = msg.get_payload(decode=True)
                 if payload:
-                    text = payload.decode('utf-8', errors='ignore')
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    return text[:max_length] + ('...' if len(text) > max_length else '')
+                    return self._snippet_from_payload(payload, max_length)
         except:
             pass
         return ''
+    
+    @staticmethod
+    def _snippet_from_payload(payload: bytes, max_length: int) -> str:
+        """Decode and clean only the head of a body; the rest is never shown."""
+        text = payload[:SNIPPET_SCAN_BYTES].decode('utf-8', errors='ignore')
+        # Clean up
+        text = _WS_RE.sub(' ', text).strip()
+        return text[:max_length] + ('...' if len(text) > max_length else '')
+
+
+# ============================================================================
+# IMAP CONNECTION POOL
+# ============================================================================
+
+# Idle logged-in sessions keyed by lowercased account address. TLS + LOGIN
+# to Gmail costs several hundred ms, so sessions are reused across checks
+# and kept alive with a periodic NOOP - but only while checks keep coming.
+_imap_pool: Dict[str, List[GmailResponseChecker]] = {}
+_imap_pool_lock = threading.Lock()
+_keepalive_timer: Optional[threading.Timer] = None
+IMAP_KEEPALIVE_SECONDS = 300
+# Sessions unused for this long are logged out instead of kept alive
+IMAP_IDLE_TIMEOUT_SECONDS = 900
+
+
+def get_pooled_checker(email_address: str, app_password: str) -> GmailResponseChecker:
+    """Take an idle checker for this account from the pool, or create one."""
+    key = email_address.lower().strip()
+    with _imap_pool_lock:
+        idle = _imap_pool.get(key, [])
+        while idle:
+            checker = idle.pop()
+            if checker.password == app_password:
+                return checker
+            # Password changed since this session was opened
+            checker.disconnect()
+    return GmailResponseChecker(email_address, app_password)
+
+
+def release_checker(checker: GmailResponseChecker) -> None:
+    """Return a checker to the pool; dead sessions are simply dropped."""
+    checker.last_used = time.monotonic()
+    _return_to_pool(checker)
+
+
+def _return_to_pool(checker: GmailResponseChecker) -> None:
+    """Pool a live checker without touching its last-used time."""
+    if not checker.imap:
+        return
+    key = checker.email.lower().strip()
+    with _imap_pool_lock:
+        idle = _imap_pool.setdefault(key, [])
+        if len(idle) >= MAX_IMAP_CONNECTIONS:
+            checker.disconnect()
+            return
+        idle.append(checker)
+        _schedule_keepalive()
+
+
+def _schedule_keepalive() -> None:
+    """Start the NOOP timer if it is not already pending. Caller holds the lock."""
+    global _keepalive_timer
+    if _keepalive_timer is None:
+        _keepalive_timer = threading.Timer(IMAP_KEEPALIVE_SECONDS, _keepalive)
+        _keepalive_timer.daemon = True
+        _keepalive_timer.start()
+
+
+def _keepalive() -> None:
+    """
+    NOOP every idle session; log out the ones unused for
+    IMAP_IDLE_TIMEOUT_SECONDS and discard the ones the server has closed.
+    
+    Only sessions that go back into the pool re-arm the timer, so it stops
+    once the pool drains.
+    """
+    global _keepalive_timer
+    with _imap_pool_lock:
+        _keepalive_timer = None
+        idle = [c for checkers in _imap_pool.values() for c in checkers]
+        _imap_pool.clear()
+    
+    # NOOP outside the lock so checkouts are not blocked on the network
+    now = time.monotonic()
+    for checker in idle:
+        if now - checker.last_used > IMAP_IDLE_TIMEOUT_SECONDS:
+            checker.disconnect()
+            continue
+        try:
+            checker.imap.noop()
+        except (imaplib.IMAP4.error, OSError):
+            checker.disconnect()
+        _return_to_pool(checker)
 
 
 class ResponseTracker:
@@ -172,8 +499,30 @@ class ResponseTracker:
         # NO LOCAL STORAGE - Everything goes to Google Sheets
         self.sent_emails: List[SentEmail] = []
         self.responses: List[Response] = []
+        # coach_email_key of every responder, for O(1) has_responded
+        self._responded_emails: Set[str] = set()
+        # (coach_email_key, subject) of every recorded response, for poll dedup
+        self._response_keys: Set[Tuple[str, str]] = set()
+        # Most recent SentEmail per coach_email_key
+        self._last_sent_by_email: Dict[str, SentEmail] = {}
+        # Running totals behind get_stats, kept current by _track_sent
+        self._unique_coaches: Set[str] = set()
+        self._n_initial = 0
+        self._n_followup = 0
         self._sheets_client = None
         self._spreadsheet = None
+        # EmailLog data rows (header excluded) as last read/written, and the
+        # sheet row number of each coach's first row, so marking a response
+        # does not re-download the whole worksheet
+        self._rows_cache: Optional[List[List[str]]] = None
+        self._email_to_rowidx: Dict[str, int] = {}
+        # Sent-email rows not yet written to Sheets
+        self._append_buffer: List[list] = []
+        self._append_lock = threading.Lock()
+        # Pending time-bound flush while rows are queued
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self.flush)
         self._load_from_sheets()
 
     def _get_sheets_connection(self):
@@ -240,35 +589,21 @@ class ResponseTracker:
             if not sheet:
                 return
 
-            all_data = sheet.get_all_values()
-            if len(all_data) < 2:
+            rows = self._read_log_rows(sheet)
+            self._cache_rows(rows)
+            if not rows:
                 return
 
-            headers = all_data[0]
-            for row in all_data[1:]:
+            for row in rows:
                 if len(row) < 8:
                     continue
                 try:
-                    self.sent_emails.append(SentEmail(
-                        coach_email=row[0],
-                        coach_name=row[1],
-                        school=row[2],
-                        division=row[3],
-                        coach_type=row[4],
-                        template_id=row[5],
-                        followup_number=int(row[6]) if row[6] else 0,
-                        sent_at=row[7]
-                    ))
+                    sent_email = SentEmail.from_sheet_row(row)
+                    self._track_sent(sent_email)
                     # Check if responded
                     if len(row) > 8 and row[8].lower() == 'yes':
-                        self.responses.append(Response(
-                            coach_email=row[0],
-                            coach_name=row[1],
-                            school=row[2],
-                            subject='',
-                            snippet='',
-                            received_at=row[9] if len(row) > 9 else ''
-                        ))
+                        response = Response.from_sheet_row(row)
+                        self._track_response(response)
                 except Exception as e:
                     logger.warning(f"Error loading row: {e}")
 
@@ -276,27 +611,114 @@ class ResponseTracker:
         except Exception as e:
             logger.error(f"Error loading from sheets: {e}")
 
+    def _read_log_rows(self, sheet) -> List[List[str]]:
+        """
+        Read the EmailLog data rows (header excluded) in one values.get.
+        
+        Goes straight to the Sheets API with a bounded A:J range instead of
+        get_all_values, and asks for nothing but the values. Rows come back
+        unpadded, so callers must length-check as before.
+        """
+        result = sheet.spreadsheet.values_get(
+            f"'{sheet.title}'!A2:J",
+            params={'majorDimension': 'ROWS', 'fields': 'values'}
+        )
+        return result.get('values', [])
+
+    def _track_sent(self, sent_email: SentEmail):
+        """Add a sent email to memory and update the derived indexes."""
+        self.sent_emails.append(sent_email)
+        self._last_sent_by_email[sent_email.coach_email_key] = sent_email
+        self._unique_coaches.add(sent_email.coach_email_key)
+        if sent_email.followup_number == 0:
+            self._n_initial += 1
+        elif sent_email.followup_number > 0:
+            self._n_followup += 1
+
+    def _track_response(self, response: Response):
+        """Add a response to memory and update the derived indexes."""
+        self.responses.append(response)
+        self._responded_emails.add(response.coach_email_key)
+        self._response_keys.add((response.coach_email_key, response.subject))
+
+    def _cache_rows(self, rows: List[List[str]]):
+        """Replace the EmailLog row cache and rebuild the email -> row index."""
+        self._rows_cache = rows
+        self._email_to_rowidx = {}
+        for row_idx, row in enumerate(rows, start=2):
+            if row:
+                self._email_to_rowidx.setdefault(row[0].lower().strip(), row_idx)
+
     def _save_to_sheets(self, sent_email: SentEmail):
-        """Save a sent email record to Google Sheets."""
-        try:
-            sheet = self._get_or_create_email_log_sheet()
-            if not sheet:
+        """
+        Queue a sent email record for Google Sheets.
+        
+        Rows are written APPEND_BATCH_SIZE at a time by flush(), or
+        APPEND_FLUSH_SECONDS after being queued if the batch does not fill;
+        call flush() at the end of a send batch to write the remainder.
+        """
+        row = [
+            sent_email.coach_email,
+            sent_email.coach_name,
+            sent_email.school,
+            sent_email.division,
+            sent_email.coach_type,
+            sent_email.template_id,
+            sent_email.followup_number,
+            sent_email.sent_at,
+            '',  # responded
+            ''   # response_date
+        ]
+        with self._append_lock:
+            self._append_buffer.append(row)
+            full = len(self._append_buffer) >= APPEND_BATCH_SIZE
+            if not full:
+                self._schedule_flush()
+
+        if full:
+            self.flush()
+
+    def _schedule_flush(self):
+        """Start the time-bound flush if none is pending. Caller holds _append_lock."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(APPEND_FLUSH_SECONDS, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Write all queued sent-email rows to the EmailLog sheet in one call."""
+        # One flush at a time, so the row index follows the sheet's append order
+        with self._flush_lock:
+            with self._append_lock:
+                rows, self._append_buffer = self._append_buffer, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not rows:
                 return
 
-            sheet.append_row([
-                sent_email.coach_email,
-                sent_email.coach_name,
-                sent_email.school,
-                sent_email.division,
-                sent_email.coach_type,
-                sent_email.template_id,
-                sent_email.followup_number,
-                sent_email.sent_at,
-                '',  # responded
-                ''   # response_date
-            ])
-        except Exception as e:
-            logger.error(f"Error saving to sheets: {e}")
+            try:
+                sheet = self._get_or_create_email_log_sheet()
+                if not sheet:
+                    raise RuntimeError("EmailLog sheet unavailable")
+
+                sheet.append_rows(rows, value_input_option='RAW')
+            except Exception as e:
+                logger.error(f"Error saving to sheets: {e}")
+                # Keep the rows for the next flush, and retry them on the timer
+                with self._append_lock:
+                    self._append_buffer[:0] = rows
+                    self._schedule_flush()
+                return
+
+            # Only rows that really landed get a place in the row index
+            with self._append_lock:
+                if self._rows_cache is not None:
+                    for row in rows:
+                        self._rows_cache.append(row)
+                        self._email_to_rowidx.setdefault(
+                            row[0].lower().strip(), len(self._rows_cache) + 1
+                        )
     
     def record_sent(self, coach_email: str, coach_name: str, school: str,
                     division: str, coach_type: str, template_id: str = '',
@@ -309,24 +731,32 @@ class ResponseTracker:
             division=division,
             coach_type=coach_type,
             template_id=template_id,
-            followup_number=followup_number
+            followup_number=followup_number,
+            sent_at=datetime.now().isoformat()
         )
-        self.sent_emails.append(sent_email)
+        self._track_sent(sent_email)
         # Save to Google Sheets (not local file)
         self._save_to_sheets(sent_email)
 
     def record_response(self, coach_email: str, subject: str, snippet: str,
                        received_at: str = None) -> None:
         """Record a response - updates Google Sheets."""
+        response = self._add_response(coach_email, subject, snippet, received_at)
+
+        # Update Google Sheets - mark as responded
+        self._mark_responded_in_sheets([(coach_email, response.received_at)])
+
+    def _add_response(self, coach_email: str, subject: str, snippet: str,
+                      received_at: str = None) -> Response:
+        """Record a response in memory only; the caller updates Sheets."""
         # Find coach info from sent emails
         coach_name = ''
         school = ''
 
-        for sent in reversed(self.sent_emails):
-            if sent.coach_email.lower() == coach_email.lower():
-                coach_name = sent.coach_name
-                school = sent.school
-                break
+        sent = self._last_sent_by_email.get(coach_email.lower().strip())
+        if sent:
+            coach_name = sent.coach_name
+            school = sent.school
 
         response = Response(
             coach_email=coach_email.lower().strip(),
@@ -336,51 +766,101 @@ class ResponseTracker:
             snippet=snippet,
             received_at=received_at or datetime.now().isoformat()
         )
-        self.responses.append(response)
-
-        # Update Google Sheets - mark as responded
-        self._mark_responded_in_sheets(coach_email, received_at or datetime.now().isoformat())
+        self._track_response(response)
+        return response
 
-    def _mark_responded_in_sheets(self, coach_email: str, response_date: str):
-        """Mark a coach as responded in the EmailLog sheet."""
+    def _mark_responded_in_sheets(self, responded: Iterable[Tuple[str, str]]):
+        """
+        Mark coaches as responded in the EmailLog sheet.
+        
+        Takes (coach_email, response_date) pairs and writes all of them
+        in a single batch_update.
+        """
         try:
+            pending = {}
+            for coach_email, response_date in responded:
+                pending[coach_email.lower().strip()] = (coach_email, response_date)
+            if not pending:
+                return
+
+            # Queued rows must exist in the sheet before they can be marked
+            self.flush()
+
             sheet = self._get_or_create_email_log_sheet()
             if not sheet:
                 return
 
-            all_data = sheet.get_all_values()
-            coach_email_lower = coach_email.lower().strip()
+            if self._rows_cache is None:
+                # Startup load failed; read the sheet once to build the index
+                self._cache_rows(self._read_log_rows(sheet))
+                row_by_email = self._lookup_rows(pending)
+            else:
+                row_by_email = self._verified_rows(sheet, pending)
 
-            for row_idx, row in enumerate(all_data[1:], start=2):
-                if len(row) > 0 and row[0].lower().strip() == coach_email_lower:
-                    # Update responded column
-                    sheet.update_cell(row_idx, 9, 'yes')  # Column I = responded
-                    sheet.update_cell(row_idx, 10, response_date)  # Column J = response_date
+            updates = []
+            for email_key, (coach_email, response_date) in pending.items():
+                row_idx = row_by_email.get(email_key)
+                if row_idx:
+                    # Column I = responded, Column J = response_date
+                    updates.append({'range': f'I{row_idx}:J{row_idx}',
+                                    'values': [['yes', response_date]]})
+                    row = self._rows_cache[row_idx - 2]
+                    row.extend([''] * (10 - len(row)))
+                    row[8:10] = ['yes', response_date]
                     logger.info(f"Marked {coach_email} as responded in EmailLog")
-                    break
+
+            if updates:
+                sheet.batch_update(updates, value_input_option='RAW')
         except Exception as e:
             logger.error(f"Error marking responded: {e}")
     
+    def _lookup_rows(self, email_keys: Iterable[str]) -> Dict[str, int]:
+        """Sheet row number of each known coach, from the row index."""
+        return {key: self._email_to_rowidx[key]
+                for key in email_keys if key in self._email_to_rowidx}
+
+    def _verified_rows(self, sheet, email_keys: Dict[str, tuple]) -> Dict[str, int]:
+        """
+        Row numbers for email_keys, checked against the sheet before writing.
+        
+        The index dates from an earlier read, and the EmailLog tab may have
+        been sorted, filtered or edited since (or appended to by another
+        process). One batchGet of column A for the target rows confirms
+        them; on any mismatch or unknown coach the index is rebuilt.
+        """
+        rows = self._lookup_rows(email_keys)
+        if len(rows) == len(email_keys):
+            result = sheet.spreadsheet.values_batch_get(
+                [f"'{sheet.title}'!A{row_idx}" for row_idx in rows.values()],
+                params={'majorDimension': 'ROWS', 'fields': 'valueRanges(values)'}
+            )
+            value_ranges = result.get('valueRanges', [])
+            if len(value_ranges) == len(rows) and all(
+                (value_range.get('values') or [['']])[0][0].lower().strip() == key
+                for key, value_range in zip(rows, value_ranges)
+            ):
+                return rows
+
+        logger.info("EmailLog rows moved since last read; rebuilding row index")
+        self._cache_rows(self._read_log_rows(sheet))
+        return self._lookup_rows(email_keys)
+
     def has_responded(self, coach_email: str) -> bool:
         """Check if a coach has responded."""
-        email_lower = coach_email.lower().strip()
-        return any(r.coach_email.lower() == email_lower for r in self.responses)
+        return coach_email.lower().strip() in self._responded_emails
     
     def get_stats(self) -> Dict:
         """Get overall statistics."""
-        unique_coaches = set(e.coach_email for e in self.sent_emails)
-        unique_responders = set(r.coach_email for r in self.responses)
-        
-        initial_emails = [e for e in self.sent_emails if e.followup_number == 0]
-        followup_emails = [e for e in self.sent_emails if e.followup_number > 0]
+        unique_coaches = self._unique_coaches
+        unique_responders = self._responded_emails
         
         response_rate = (len(unique_responders) / len(unique_coaches) * 100) if unique_coaches else 0
         
         return {
             'total_emails_sent': len(self.sent_emails),
             'unique_coaches_contacted': len(unique_coaches),
-            'initial_emails': len(initial_emails),
-            'followup_emails': len(followup_emails),
+            'initial_emails': self._n_initial,
+            'followup_emails': self._n_followup,
             'total_responses': len(self.responses),
             'unique_responders': len(unique_responders),
             'response_rate': round(response_rate, 1)
@@ -389,20 +869,20 @@ class ResponseTracker:
     def get_stats_by_division(self) -> Dict[str, Dict]:
         """Get response rates by division."""
         divisions = {}
+        # Division of each coach's first sent email
+        email_to_div: Dict[str, str] = {}
         
         for sent in self.sent_emails:
             div = sent.division or 'Unknown'
             if div not in divisions:
                 divisions[div] = {'coaches': set(), 'responders': set()}
             divisions[div]['coaches'].add(sent.coach_email)
+            email_to_div.setdefault(sent.coach_email_key, div)
         
         for resp in self.responses:
-            # Find division for this responder
-            for sent in self.sent_emails:
-                if sent.coach_email.lower() == resp.coach_email.lower():
-                    div = sent.division or 'Unknown'
-                    divisions[div]['responders'].add(resp.coach_email)
-                    break
+            div = email_to_div.get(resp.coach_email_key)
+            if div is not None:
+                divisions[div]['responders'].add(resp.coach_email)
         
         # Calculate rates
         result = {}
@@ -434,16 +914,18 @@ class ResponseTracker:
         Prioritizes: contacted multiple times, no response yet, higher divisions.
         """
         # Get coaches who haven't responded
-        responded_emails = set(r.coach_email.lower() for r in self.responses)
+        responded_emails = self._responded_emails
         
         # Count contacts per coach
         coach_contacts: Dict[str, Dict] = {}
+        last_contact_dt: Dict[str, Optional[datetime]] = {}
         
         for sent in self.sent_emails:
-            email_lower = sent.coach_email.lower()
+            email_lower = sent.coach_email_key
             if email_lower in responded_emails:
                 continue  # Skip responded
             
+            sent_dt = sent.sent_at_dt
             if email_lower not in coach_contacts:
                 coach_contacts[email_lower] = {
                     'coach_email': sent.coach_email,
@@ -453,32 +935,35 @@ class ResponseTracker:
                     'times_contacted': 0,
                     'last_contact': sent.sent_at
                 }
+                last_contact_dt[email_lower] = sent_dt
             
             coach_contacts[email_lower]['times_contacted'] += 1
-            if sent.sent_at > coach_contacts[email_lower]['last_contact']:
+            last_dt = last_contact_dt[email_lower]
+            if sent_dt is not None and (last_dt is None or sent_dt > last_dt):
                 coach_contacts[email_lower]['last_contact'] = sent.sent_at
+                last_contact_dt[email_lower] = sent_dt
         
-        # Score and sort
-        def score(coach: Dict) -> int:
+        # Score each coach once, then sort on the precomputed scores
+        now = datetime.now()
+        scored = []
+        for email_lower, coach in coach_contacts.items():
             s = 0
             # More contacts = higher priority (up to 3)
             s += min(coach['times_contacted'], 3) * 10
             # Division scoring
-            div_scores = {'NAIA': 30, 'JUCO': 30, 'D3': 25, 'D2': 20, 'FCS': 15, 'FBS': 10}
-            s += div_scores.get(coach['division'], 5)
+            s += DIVISION_LEAD_SCORES.get(coach['division'], 5)
             # Recency (contacted in last 7 days = +20, 14 days = +10)
-            try:
-                last = datetime.fromisoformat(coach['last_contact'].replace('Z', '+00:00'))
-                days_ago = (datetime.now() - last.replace(tzinfo=None)).days
+            last = last_contact_dt[email_lower]
+            if last is not None:
+                days_ago = (now - last).days
                 if days_ago <= 7:
                     s += 20
                 elif days_ago <= 14:
                     s += 10
-            except:
-                pass
-            return s
+            scored.append((s, coach))
         
-        leads = sorted(coach_contacts.values(), key=score, reverse=True)[:limit]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        leads = [coach for _, coach in scored[:limit]]
         return leads
     
     def check_gmail_for_responses(self, email_address: str, 
@@ -487,39 +972,56 @@ class ResponseTracker:
         Check Gmail for new responses from coaches we've emailed.
         Returns (new_count, list of new responses)
         """
-        # Get all coach emails we've contacted
-        coach_emails = list(set(e.coach_email for e in self.sent_emails))
+        # Get all coach emails we've contacted (snapshot; shards are sliced from it)
+        coach_emails = list(self._unique_coaches)
         
         if not coach_emails:
             return 0, []
         
-        # Get emails we've already recorded as responses
-        known_responses = set(
-            (r.coach_email.lower(), r.subject) for r in self.responses
-        )
+        # Responses we've already recorded, kept current by _track_response
+        known_responses = self._response_keys
         
-        checker = GmailResponseChecker(email_address, app_password)
+        # Shard large cohorts across a few IMAP sessions so the batched
+        # searches run concurrently instead of back to back
+        batches = -(-len(coach_emails) // SEARCH_BATCH_SIZE)
+        workers = max(1, min(MAX_IMAP_CONNECTIONS, batches))
+        checkers = [get_pooled_checker(email_address, app_password) for _ in range(workers)]
         
         try:
-            raw_responses = checker.check_for_responses(coach_emails)
+            if workers == 1:
+                raw_responses = checkers[0].check_for_responses(coach_emails)
+            else:
+                shards = [coach_emails[i::workers] for i in range(workers)]
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(
+                        lambda checker, shard: checker.check_for_responses(shard),
+                        checkers, shards
+                    )
+                    raw_responses = [resp for result in results for resp in result]
             
             new_responses = []
+            responded = []
             for resp in raw_responses:
                 key = (resp['coach_email'].lower(), resp['subject'])
                 if key not in known_responses:
                     # New response
-                    self.record_response(
+                    response = self._add_response(
                         coach_email=resp['coach_email'],
                         subject=resp['subject'],
                         snippet=resp['snippet'],
                         received_at=resp.get('date', datetime.now().isoformat())
                     )
+                    responded.append((resp['coach_email'], response.received_at))
                     new_responses.append(resp)
             
+            # One Sheets write for the whole poll
+            self._mark_responded_in_sheets(responded)
+            
             return len(new_responses), new_responses
             
         finally:
-            checker.disconnect()
+            for checker in checkers:
+                release_checker(checker)
 
 
 # ============================================================================
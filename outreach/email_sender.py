@@ -16,26 +16,298 @@ Version: 3.0.0
 """
 
 import os
+import re
 import sys
 import json
 import time
+import atexit
 import smtplib
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional, List, Dict, Any, Tuple, Callable
+import threading
+import queue
+import base64
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache, cached_property
+from operator import itemgetter
+from email.header import Header
+from email.parser import BytesHeaderParser
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable
 from dataclasses import dataclass, field
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 # State file for tracking
 STATE_DIR = Path.home() / '.coach_outreach'
 SENT_EMAILS_FILE = STATE_DIR / 'sent_emails.json'
 ANALYTICS_FILE = STATE_DIR / 'analytics.json'
+# Append-only log of mark_sent records since the last sent_emails.json snapshot
+SENT_EMAILS_LOG = STATE_DIR / 'sent_emails.log'
+SNAPSHOT_EVERY = 1000  # log records before the snapshot is rewritten
+LOG_FSYNC_EVERY = 20  # log records between fsyncs
+# Analytics saves are coalesced: write after this many events or seconds
+ANALYTICS_FLUSH_EVENTS = 50
+ANALYTICS_FLUSH_SECONDS = 5.0
+
+# SMTP session reuse: NOOP-check an idle session before sending, and only
+# drop it for replies that mean the session itself is no good
+SMTP_IDLE_CHECK_SECONDS = 60
+SMTP_CONNECT_ATTEMPTS = 3  # reconnects back off 1s, 2s, ...
+SMTP_FATAL_CODES = frozenset([535, 550, 553, 554])
+
+# Inbox scan: messages per FETCH, and only the headers check_for_responses reads
+# (BODY.PEEK leaves the \Seen flag alone)
+IMAP_FETCH_BATCH = 50
+_IMAP_FETCH_ITEMS = '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])'
+
+# Coach addresses OR-ed into one server-side SEARCH
+IMAP_SEARCH_BATCH = 50
+
+# IMAP sessions stay logged in between checks; NOOP one idle this long before reuse
+IMAP_IDLE_CHECK_SECONDS = 60
+
+# The FETCH returns only header lines, so no MIME tree is needed
+_HEADER_PARSER = BytesHeaderParser()
+
+# Raw From header, folded continuation lines included
+_FROM_LINE_RE = re.compile(rb'^From:[ \t]*([^\r\n]*(?:\r?\n[ \t][^\r\n]*)*)', re.M | re.I)
+# Address inside the first <...> of a From value
+_FROM_ADDR_RE = re.compile(rb'<([^<>]*)')
+
+# Sheet cell writes from send_to_coaches are sent in batch_update calls of this size
+SHEET_UPDATE_BATCH = 50
+# A failed batch is retried once after this pause, then written cell by cell
+SHEET_RETRY_DELAY_SECONDS = 2.0
+
+# Basic email validation - must have @ and domain
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+# Email cells: characters dropped anywhere, and separators between multiple addresses
+_EMAIL_STRIP = str.maketrans('', '', ' \r\n')
+_EMAIL_SPLIT_RE = re.compile(r'[,;]')
+# Line breaks smtplib normalizes to CRLF (str.splitlines() also splits on \v, \f, \x85, ...)
+_LINE_BREAK_RE = re.compile(r'\r\n|\r|\n')
+# Sheet cell values that mean "not contacted"; anything else counts as contacted
+_NOT_CONTACTED_VALUES = frozenset(['', 'no', 'false'])
+# Email status values that mark an address as unusable
+_BAD_EMAIL_STATUSES = frozenset(['wrong', 'bad', 'invalid', 'bounced'])
+# {placeholder} in the default subject/body templates
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+
+_today_cache = ['', 0.0]  # [ISO date, monotonic time it must be recomputed by]
+
+
+def _today_iso() -> str:
+    """
+    date.today().isoformat(), cached.
+    
+    Recomputed at most once a minute, and never later than the next
+    midnight, so the per-email tracker calls skip the clock read and format.
+    """
+    now = time.monotonic()
+    if now >= _today_cache[1]:
+        current = datetime.now()
+        midnight = datetime.combine(current.date() + timedelta(days=1), datetime.min.time())
+        _today_cache[0] = current.date().isoformat()
+        _today_cache[1] = now + min(60.0, (midnight - current).total_seconds())
+    return _today_cache[0]
+
+
+def _fill_placeholders(template: str, variables: Dict[str, str]) -> str:
+    """
+    Substitute {key} placeholders in one pass.
+    
+    Unknown placeholders and any other braces are left exactly as written,
+    so user-edited templates never need escaping.
+    """
+    return _PLACEHOLDER_RE.sub(
+        lambda m: str(variables[m.group(1)]) if m.group(1) in variables else m.group(0),
+        template,
+    )
+
+
+_template_picker = None  # enterprise get_random_template_for_coach, or False if unavailable
+
+
+def _get_template_picker() -> Optional[Callable]:
+    """
+    Import enterprise.templates on first use and remember the outcome.
+    
+    Kept lazy so importing this module doesn't pull in the enterprise
+    package; a failed import is cached too rather than re-searching
+    sys.path for every email. The template choice itself is not cached:
+    get_next_template rotates through the templates on every call.
+    """
+    global _template_picker
+    if _template_picker is None:
+        try:
+            from enterprise.templates import get_random_template_for_coach
+            _template_picker = get_random_template_for_coach
+        except ImportError:
+            logger.debug("Enterprise templates not available, using default")
+            _template_picker = False
+    return _template_picker or None
+
+
+def _build_message(from_addr: str, to_addr: str, subject: str, body: str) -> bytes:
+    """
+    Serialize a plain-text email straight to RFC 5322 bytes.
+    
+    Skips the MIME object tree and Generator for the only message shape
+    we send. ASCII bodies go out as 7bit, anything else as base64 UTF-8
+    (what MIMEText picks). The Subject is folded at 78 columns, and RFC 2047
+    encoded if non-ASCII, by the same Header call the compat32 policy makes.
+    """
+    subject = ' '.join(_LINE_BREAK_RE.split(subject))
+    subject = Header(subject, header_name='Subject').encode(linesep='\r\n')
+    
+    # Splitting keeps a trailing '' so a final newline survives the join
+    lines = _LINE_BREAK_RE.split(body)
+    if body.isascii() and all(len(line) <= 998 for line in lines):
+        text = '\r\n'.join(lines).encode('ascii')
+        charset, cte = 'us-ascii', '7bit'
+    else:
+        text = base64.encodebytes(body.encode('utf-8')).replace(b'\n', b'\r\n')
+        charset, cte = 'utf-8', 'base64'
+    
+    headers = (
+        f"From: {from_addr}\r\n"
+        f"To: {to_addr}\r\n"
+        f"Subject: {subject}\r\n"
+        f"MIME-Version: 1.0\r\n"
+        f"Content-Type: text/plain; charset=\"{charset}\"\r\n"
+        f"Content-Transfer-Encoding: {cte}\r\n"
+        f"\r\n"
+    )
+    return headers.encode('ascii') + text
+
+
+def _a1(row: int, col: int) -> str:
+    """A1 reference for a 1-indexed (row, col), e.g. (2, 28) -> 'AB2'."""
+    letters = ''
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return f"{letters}{row}"
+
+
+@lru_cache(maxsize=8192)
+def _clean_email(email) -> str:
+    """
+    Clean and validate a single email cell ('' if unusable).
+    
+    Cached by raw cell value: dual-role rows repeat the same address in
+    both email columns, and the sheet is re-scanned on every refresh.
+    """
+    if not email:
+        return ''
+    # Remove any newlines or extra whitespace
+    email = str(email).strip().lower().translate(_EMAIL_STRIP)
+    # If multiple emails separated by comma or semicolon, take first one
+    email = _EMAIL_SPLIT_RE.split(email, 1)[0].strip()
+    return email if len(email) < 100 and _EMAIL_RE.match(email) else ''
+
+
+@lru_cache(maxsize=4096)
+def _parse_mdy(value: str) -> Optional[date]:
+    """
+    Parse a sheet date like '3/14/2025' or '3/ 4/2025' the way strptime's
+    '%m/%d/%Y' does, except that only ASCII digits are accepted.
+    
+    Split by hand and cached by raw string: next-contact columns hold few
+    distinct dates, and strptime re-reads its format on every call.
+    """
+    parts = value.split('/')
+    if len(parts) != 3:
+        return None
+    m, d, y = parts
+    if len(d) == 2 and d[0] == ' ':
+        d = d[1]  # %d also takes a space-padded day
+    digits = m + d + y
+    if not (0 < len(m) <= 2 and 0 < len(d) <= 2 and len(y) == 4
+            and digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return date(int(y), int(m), int(d))
+    except ValueError:
+        return None
+
+
+def _quarantine_state_file(path: Path, error: Exception):
+    """
+    Move an unreadable state file to <name>.bak.
+    
+    Otherwise the next save would overwrite the user's history with the
+    empty defaults the tracker started from.
+    """
+    backup = path.with_suffix('.bak')
+    logger.error(f"Corrupt state file {path} ({error}); moving it to {backup}")
+    try:
+        path.replace(backup)
+    except OSError as e:
+        logger.error(f"Failed to move {path} aside: {e}")
+
+
+def _write_atomic(path: Path, payload: bytes):
+    """
+    Replace path with payload without ever leaving a half-written file.
+    
+    Writes a sibling .tmp, fsyncs it once and renames it over the target,
+    so a crash mid-save leaves the previous state intact.
+    """
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _encode_default(obj):
+    """Encoder hook: write the trackers' in-memory sets as JSON arrays."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Stdlib fallback: no indent and no separator padding keeps json on its C encoder
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), default=_encode_default)
+
+
+def _dumps_state(data: Dict) -> bytes:
+    """
+    Encode a state dict for disk - orjson when installed, else stdlib json.
+    
+    Written compact (no indentation): the files are only read back by the
+    trackers, and the pretty-printed form was about a third larger.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=_encode_default, option=orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(data).encode('utf-8')
+
+
+def _dumps_line(record: Dict) -> bytes:
+    """Encode one log record as a single JSON line."""
+    if HAS_ORJSON:
+        return orjson.dumps(record) + b'\n'
+    return _JSON_ENCODER.encode(record).encode('utf-8') + b'\n'
+
+
+def _loads_state(raw: bytes) -> Dict:
+    """Decode a state file written by _dumps_state."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 # ============================================================================
@@ -116,61 +388,170 @@ class EmailTracker:
     """Tracks sent emails and analytics."""
     
     def __init__(self):
-        self.sent_emails = {}  # email -> {date, school, type}
+        self.sent_emails = {}  # email -> (date, school, type)
         self.daily_count = 0
-        self.last_date = date.today().isoformat()
+        self.last_date = _today_iso()
+        self._log_fh = None
+        self._log_records = 0  # records in SENT_EMAILS_LOG since the snapshot
+        self._dirty = False  # mark_sent since the last snapshot
         self._load()
     
     def _load(self):
-        """Load state from disk."""
+        """Load state from disk: the snapshot, then replay the append log."""
         if SENT_EMAILS_FILE.exists():
             try:
-                with open(SENT_EMAILS_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.sent_emails = data.get('sent_emails', {})
-                    self.daily_count = data.get('daily_count', 0)
-                    self.last_date = data.get('last_date', date.today().isoformat())
-            except:
-                pass
+                with open(SENT_EMAILS_FILE, 'rb') as f:
+                    data = _loads_state(f.read())
+                if not isinstance(data, dict):
+                    raise ValueError(f"expected an object, got {type(data).__name__}")
+                sent = data.get('sent')
+                if sent is not None:
+                    self.sent_emails = dict(zip(
+                        sent['emails'],
+                        zip(sent['dates'], sent['schools'], sent['types']),
+                    ))
+                else:
+                    # Older object-per-record snapshot
+                    self.sent_emails = {
+                        email: (r['date'], r['school'], r['type'])
+                        for email, r in data.get('sent_emails', {}).items()
+                    }
+                self.daily_count = data.get('daily_count', 0)
+                self.last_date = data.get('last_date', _today_iso())
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                _quarantine_state_file(SENT_EMAILS_FILE, e)
+            except OSError as e:
+                logger.error(f"Failed to read email state: {e}")
+        
+        if SENT_EMAILS_LOG.exists():
+            try:
+                with open(SENT_EMAILS_LOG, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            self._apply_log_record(_loads_state(line))
+                        except (ValueError, KeyError, TypeError):
+                            continue  # torn write at the end of the log
+                        self._log_records += 1
+            except OSError as e:
+                logger.error(f"Failed to read email log: {e}")
         
         # Reset daily count if new day
-        if self.last_date != date.today().isoformat():
+        if self.last_date != _today_iso():
             self.daily_count = 0
-            self.last_date = date.today().isoformat()
+            self.last_date = _today_iso()
+    
+    def _apply_log_record(self, record: Dict):
+        """Replay one mark_sent log record on top of the snapshot."""
+        email = record['email']
+        previous = self.sent_emails.get(email)
+        if previous and previous[0] == record['date']:
+            return  # already in the snapshot
+        self.sent_emails[email] = (record['date'], record['school'], record['type'])
+        day = record['date'][:10]
+        if day == self.last_date:
+            self.daily_count += 1
+        elif day > self.last_date:
+            self.last_date = day
+            self.daily_count = 1
+    
+    def _append_log(self, record: Dict):
+        """Append one record to the log; rewrite the snapshot when it grows."""
+        try:
+            if self._log_fh is None:
+                STATE_DIR.mkdir(parents=True, exist_ok=True)
+                self._log_fh = open(SENT_EMAILS_LOG, 'ab')
+            self._log_fh.write(_dumps_line(record))
+            self._log_fh.flush()
+            self._log_records += 1
+            if self._log_records % LOG_FSYNC_EVERY == 0:
+                os.fsync(self._log_fh.fileno())
+        except Exception as e:
+            logger.error(f"Failed to append email log: {e}")
+            return
+        
+        if self._log_records >= SNAPSHOT_EVERY:
+            self.save()
     
     def save(self):
-        """Save state to disk."""
+        """Write a full snapshot to disk and start a fresh append log."""
+        if not self._dirty:
+            return
         STATE_DIR.mkdir(parents=True, exist_ok=True)
         try:
-            with open(SENT_EMAILS_FILE, 'w') as f:
-                json.dump({
-                    'sent_emails': self.sent_emails,
-                    'daily_count': self.daily_count,
-                    'last_date': self.last_date,
-                }, f, indent=2)
+            _write_atomic(SENT_EMAILS_FILE, _dumps_state({
+                'sent': self._columns(),
+                'daily_count': self.daily_count,
+                'last_date': self.last_date,
+            }))
         except Exception as e:
             logger.error(f"Failed to save email state: {e}")
+            return
+        self._dirty = False
+        
+        # Everything in the log is now in the snapshot
+        try:
+            if self._log_fh is not None:
+                self._log_fh.close()
+            self._log_fh = open(SENT_EMAILS_LOG, 'wb')
+            self._log_records = 0
+        except Exception as e:
+            self._log_fh = None
+            logger.error(f"Failed to reset email log: {e}")
+    
+    def _columns(self) -> Dict[str, List[str]]:
+        """
+        sent_emails as parallel arrays for the snapshot.
+        
+        One array per field instead of an object per record: the field
+        names are not repeated 10k times and the decoder builds four lists
+        rather than a dict per email.
+        """
+        dates, schools, types = zip(*self.sent_emails.values()) if self.sent_emails else ((), (), ())
+        return {
+            'emails': list(self.sent_emails),
+            'dates': dates,
+            'schools': schools,
+            'types': types,
+        }
+    
+    @staticmethod
+    def _norm(email: str) -> str:
+        """Key an address is tracked under."""
+        return email.lower()
     
     def has_sent_to(self, email: str) -> bool:
         """Check if we've sent to this email."""
-        return email.lower() in self.sent_emails
+        return self._norm(email) in self.sent_emails
+    
+    def has_sent_to_norm(self, norm_email: str) -> bool:
+        """has_sent_to for an address that is already lowercased."""
+        return norm_email in self.sent_emails
+    
+    def filter_unsent(self, emails: Iterable[str]) -> List[str]:
+        """Return the emails we have not sent to yet, in order."""
+        sent = self.sent_emails
+        return [email for email in emails if email.lower() not in sent]
     
     def mark_sent(self, email: str, school: str, coach_type: str):
-        """Mark email as sent."""
-        self.sent_emails[email.lower()] = {
-            'date': datetime.now().isoformat(),
-            'school': school,
-            'type': coach_type,
-        }
+        """Mark email as sent - appends one record instead of rewriting the file."""
+        sent_at = datetime.now().isoformat()
+        email = self._norm(email)
+        self.sent_emails[email] = (sent_at, school, coach_type)
+        self._dirty = True
+        today = _today_iso()
+        if self.last_date != today:
+            # First send of a new day; the log record carries the reset
+            self.daily_count = 0
+            self.last_date = today
         self.daily_count += 1
-        self.save()
+        self._append_log({'email': email, 'date': sent_at, 'school': school, 'type': coach_type})
     
     def get_daily_count(self) -> int:
-        """Get number of emails sent today."""
-        if self.last_date != date.today().isoformat():
-            self.daily_count = 0
-            self.last_date = date.today().isoformat()
-            self.save()
+        """Get number of emails sent today (read-only; mark_sent rolls the day over)."""
+        if self.last_date != _today_iso():
+            return 0
         return self.daily_count
     
     def get_total_sent(self) -> int:
@@ -184,91 +565,160 @@ class AnalyticsTracker:
     def __init__(self):
         self.data = {
             'emails_sent': 0,
-            'emails_by_date': {},
+            'emails_by_date': defaultdict(int),
             'schools_contacted': set(),
             'responses_received': 0,
             'offers_received': 0,
+            # Sets in memory for O(1) membership; lists on disk
             'schools_by_status': {
-                'contacted': [],
-                'responded': [],
-                'interested': [],
-                'offered': [],
+                'contacted': set(),
+                'responded': set(),
+                'interested': set(),
+                'offered': set(),
             }
         }
+        # Debounced saving: record_* mark the state dirty and, once enough
+        # events pile up, nudge the writer thread, which also flushes
+        # anything left dirty every ANALYTICS_FLUSH_SECONDS
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._pending = 0
+        # maxsize=1: a request already queued covers any newer one
+        self._save_q = queue.Queue(maxsize=1)
+        self._writer = threading.Thread(target=self._writer_loop, name='analytics-writer', daemon=True)
+        # get_stats result, reused until a record_* bumps the version
+        self._stats_version = 0
+        self._stats_cache = None
+        self._stats_cache_v = -1
         self._load()
+        self._writer.start()
+        atexit.register(self.save)
     
     def _load(self):
         """Load analytics from disk."""
         if ANALYTICS_FILE.exists():
             try:
-                with open(ANALYTICS_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.data = data
-                    # Convert schools_contacted back to set
-                    if isinstance(self.data.get('schools_contacted'), list):
-                        self.data['schools_contacted'] = set(self.data['schools_contacted'])
-            except:
-                pass
+                with open(ANALYTICS_FILE, 'rb') as f:
+                    data = _loads_state(f.read())
+                if not isinstance(data, dict):
+                    raise ValueError(f"expected an object, got {type(data).__name__}")
+                # Counters stay a defaultdict so record_email_sent needs no guard
+                data['emails_by_date'] = defaultdict(int, data.get('emails_by_date') or {})
+                # Sets in memory, always - get_stats relies on it
+                data['schools_contacted'] = set(data.get('schools_contacted') or ())
+                by_status = data.get('schools_by_status')
+                if isinstance(by_status, dict):
+                    for status, schools in by_status.items():
+                        by_status[status] = set(schools)
+                self.data = data
+            except (ValueError, TypeError) as e:
+                _quarantine_state_file(ANALYTICS_FILE, e)
+            except OSError as e:
+                logger.error(f"Failed to read analytics: {e}")
     
     def save(self):
-        """Save analytics to disk."""
-        STATE_DIR.mkdir(parents=True, exist_ok=True)
-        try:
-            # Convert set to list for JSON
-            save_data = self.data.copy()
-            save_data['schools_contacted'] = list(self.data.get('schools_contacted', set()))
-            
-            with open(ANALYTICS_FILE, 'w') as f:
-                json.dump(save_data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save analytics: {e}")
+        """Save analytics to disk now (record_* leave this to the writer thread)."""
+        if not self._dirty:
+            return
+        # The write lock spans encode and write so an older snapshot can
+        # never land on disk after a newer one
+        with self._write_lock:
+            with self._lock:
+                try:
+                    payload = _dumps_state(self.data)
+                except Exception as e:
+                    logger.error(f"Failed to encode analytics: {e}")
+                    return
+                self._dirty = False
+                self._pending = 0
+            try:
+                STATE_DIR.mkdir(parents=True, exist_ok=True)
+                _write_atomic(ANALYTICS_FILE, payload)
+            except Exception as e:
+                logger.error(f"Failed to save analytics: {e}")
+                self._dirty = True
+    
+    def _mark_dirty(self):
+        """Note a change; ask the writer thread for a save once enough has piled up."""
+        self._stats_version += 1
+        self._dirty = True
+        self._pending += 1
+        if self._pending >= ANALYTICS_FLUSH_EVENTS:
+            try:
+                self._save_q.put_nowait(None)
+            except queue.Full:
+                pass  # a save is already pending and will include this change
+    
+    def _writer_loop(self):
+        """Background writer: save on request, or whatever is dirty after a quiet period."""
+        while True:
+            try:
+                self._save_q.get(timeout=ANALYTICS_FLUSH_SECONDS)
+            except queue.Empty:
+                pass
+            self.save()  # no-op unless something changed
     
     def record_email_sent(self, school: str, coach_type: str):
         """Record an email was sent."""
-        self.data['emails_sent'] = self.data.get('emails_sent', 0) + 1
-        
-        # Track by date
-        today = date.today().isoformat()
-        if 'emails_by_date' not in self.data:
-            self.data['emails_by_date'] = {}
-        self.data['emails_by_date'][today] = self.data['emails_by_date'].get(today, 0) + 1
-        
-        # Track schools
-        if 'schools_contacted' not in self.data:
-            self.data['schools_contacted'] = set()
-        self.data['schools_contacted'].add(school)
-        
-        self.save()
+        with self._lock:
+            d = self.data
+            d['emails_sent'] = d.get('emails_sent', 0) + 1
+            
+            # Track by date
+            d['emails_by_date'][_today_iso()] += 1
+            
+            # Track schools
+            sc = d.get('schools_contacted')
+            if sc is None:
+                sc = d['schools_contacted'] = set()
+            sc.add(school)
+            
+            self._mark_dirty()
     
     def record_response(self, school: str):
         """Record a response received."""
-        self.data['responses_received'] = self.data.get('responses_received', 0) + 1
-        
-        if 'schools_by_status' not in self.data:
-            self.data['schools_by_status'] = {'contacted': [], 'responded': [], 'interested': [], 'offered': []}
-        
-        if school not in self.data['schools_by_status']['responded']:
-            self.data['schools_by_status']['responded'].append(school)
-        
-        self.save()
+        with self._lock:
+            d = self.data
+            d['responses_received'] = d.get('responses_received', 0) + 1
+            
+            sbs = d.get('schools_by_status')
+            if sbs is None:
+                sbs = d['schools_by_status'] = {'contacted': set(), 'responded': set(), 'interested': set(), 'offered': set()}
+            
+            sbs['responded'].add(school)
+            
+            self._mark_dirty()
     
     def record_offer(self, school: str):
         """Record an offer received."""
-        self.data['offers_received'] = self.data.get('offers_received', 0) + 1
-        
-        if 'schools_by_status' not in self.data:
-            self.data['schools_by_status'] = {'contacted': [], 'responded': [], 'interested': [], 'offered': []}
-        
-        if school not in self.data['schools_by_status']['offered']:
-            self.data['schools_by_status']['offered'].append(school)
-        
-        self.save()
+        with self._lock:
+            d = self.data
+            d['offers_received'] = d.get('offers_received', 0) + 1
+            
+            sbs = d.get('schools_by_status')
+            if sbs is None:
+                sbs = d['schools_by_status'] = {'contacted': set(), 'responded': set(), 'interested': set(), 'offered': set()}
+            
+            sbs['offered'].add(school)
+            
+            self._mark_dirty()
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get analytics summary."""
-        schools_contacted = self.data.get('schools_contacted', set())
-        if isinstance(schools_contacted, list):
-            schools_contacted = set(schools_contacted)
+        """Get analytics summary (cached until the next record_* call; treat as read-only)."""
+        if self._stats_cache_v == self._stats_version:
+            return self._stats_cache
+        
+        with self._lock:
+            version = self._stats_version
+            stats = self._compute_stats()
+        self._stats_cache = stats
+        self._stats_cache_v = version
+        return stats
+    
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Build the get_stats summary from the current data."""
+        schools_contacted = self.data['schools_contacted']
         
         return {
             'emails_sent': self.data.get('emails_sent', 0),
@@ -278,8 +728,11 @@ class AnalyticsTracker:
             'response_rate': round(
                 (self.data.get('responses_received', 0) / max(len(schools_contacted), 1)) * 100, 1
             ),
-            'emails_by_date': self.data.get('emails_by_date', {}),
-            'schools_by_status': self.data.get('schools_by_status', {}),
+            'emails_by_date': dict(self.data.get('emails_by_date', {})),
+            'schools_by_status': {
+                status: list(schools)
+                for status, schools in self.data.get('schools_by_status', {}).items()
+            },
         }
 
 
@@ -327,8 +780,9 @@ class AthleteInfo:
     phone: str = ""
     email: str = ""
     
-    @property
+    @cached_property
     def city_state(self) -> str:
+        # Computed once: an AthleteInfo is built per send run and not mutated
         if self.city and self.state:
             return f"{self.city}, {self.state}"
         return self.city or self.state or ""
@@ -368,9 +822,32 @@ class SmartEmailSender:
     def __init__(self, config: EmailConfig, athlete: AthleteInfo):
         self.config = config
         self.athlete = athlete
-        self.tracker = EmailTracker()
-        self.analytics = AnalyticsTracker()
+        self.tracker = get_email_tracker()
+        self.analytics = get_analytics()
         self._connection = None
+        self._last_used = 0.0
+        # Template variables that come from the athlete; prepare_email adds
+        # the per-coach ones (keys kept in their original order)
+        self._base_variables = {
+            'coach_name': None,
+            'school': None,
+            'athlete_name': athlete.name,
+            'position': athlete.positions or 'Athlete',
+            'grad_year': athlete.graduation_year,
+            'height': athlete.height or '',
+            'weight': athlete.weight or '',
+            'gpa': athlete.gpa or '',
+            'hudl_link': athlete.highlight_url or '',
+            'high_school': athlete.high_school or '',
+            'city_state': athlete.city_state or '',
+            'phone': athlete.phone or '',
+            'email': athlete.email or '',
+            # Legacy variables for backward compatibility
+            'last_name': None,
+            'graduation_year': athlete.graduation_year,
+            'positions': athlete.positions or '',
+            'highlight_url': athlete.highlight_url or '',
+        }
     
     def connect(self) -> bool:
         """Connect to SMTP server."""
@@ -378,6 +855,7 @@ class SmartEmailSender:
             self._connection = smtplib.SMTP(self.config.smtp_server, self.config.smtp_port)
             self._connection.starttls()
             self._connection.login(self.config.email_address, self.config.app_password)
+            self._last_used = time.monotonic()
             logger.info("Connected to SMTP server")
             return True
         except Exception as e:
@@ -393,6 +871,41 @@ class SmartEmailSender:
                 pass
             self._connection = None
     
+    def _drop_connection(self):
+        """Forget a broken SMTP session without trying to QUIT it."""
+        if self._connection:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+    
+    def _reconnect(self) -> bool:
+        """Connect, retrying with exponential backoff."""
+        delay = 1.0
+        for attempt in range(SMTP_CONNECT_ATTEMPTS):
+            if self.connect():
+                return True
+            if attempt < SMTP_CONNECT_ATTEMPTS - 1:
+                time.sleep(delay)
+                delay *= 2
+        return False
+    
+    def _ensure_connection(self) -> bool:
+        """Reuse the open SMTP session, NOOP-checking it after an idle gap."""
+        if self._connection and time.monotonic() - self._last_used > SMTP_IDLE_CHECK_SECONDS:
+            try:
+                code, _ = self._connection.noop()
+                if code != 250:
+                    self._drop_connection()
+                else:
+                    self._last_used = time.monotonic()
+            except (smtplib.SMTPException, OSError):
+                self._drop_connection()
+        if not self._connection:
+            return self._reconnect()
+        return True
+    
     def get_coaches_to_email(self, sheet_data: List[List[str]], headers: List[str]) -> List[Dict]:
         """
         Get list of coaches to email with deduplication.
@@ -404,46 +917,22 @@ class SmartEmailSender:
         - school: school name
         - type: 'ol', 'rc', or 'dual' (if same person does both)
         """
-        import re
+        headers_lower = [h.lower().strip() for h in headers]
         
         def find_col(keywords):
-            for i, h in enumerate(headers):
-                h_lower = h.lower().strip()
+            for i, h_lower in enumerate(headers_lower):
                 for kw in keywords:
                     if kw in h_lower:
                         return i
             return -1
         
-        def is_valid_email(email):
-            """Validate email format"""
-            if not email or not isinstance(email, str):
-                return False
-            email = email.strip()
-            # Basic email validation - must have @ and domain
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(pattern, email)) and len(email) < 100
-        
-        def clean_email(email):
-            """Clean and validate a single email"""
-            if not email:
-                return ''
-            email = str(email).strip().lower()
-            # Remove any newlines or extra whitespace
-            email = email.replace('\n', '').replace('\r', '').replace(' ', '')
-            # If multiple emails separated by comma or semicolon, take first one
-            for sep in [',', ';', '\n']:
-                if sep in email:
-                    email = email.split(sep)[0].strip()
-            return email if is_valid_email(email) else ''
-        
         def is_contacted(value):
             """Check if coach has been contacted - handles various formats"""
             if not value:
                 return False
-            v = str(value).strip().lower()
             # Consider contacted if: has any text like "yes", "followed", "sent", "done", "x", "true", or a date
-            contacted_indicators = ['yes', 'followed', 'sent', 'done', 'x', 'true', 'emailed', 'contacted']
-            return any(ind in v for ind in contacted_indicators) or bool(v and v not in ['no', 'false', ''])
+            # (every such value is simply one that isn't blank/"no"/"false")
+            return str(value).strip().lower() not in _NOT_CONTACTED_VALUES
         
         # Find columns - match user's actual headers
         # School column
@@ -481,29 +970,43 @@ class SmartEmailSender:
             """Check if email is marked as wrong/bad"""
             if not value:
                 return False
-            return str(value).strip().lower() in ['wrong', 'bad', 'invalid', 'bounced']
+            return str(value).strip().lower() in _BAD_EMAIL_STATUSES
 
+        today = date.today()
+        
         def is_due_for_followup(next_contact_value):
             """Check if next_contact date is today or earlier"""
             if not next_contact_value:
                 return False
-            try:
-                from datetime import datetime
-                next_date = datetime.strptime(next_contact_value.strip(), '%m/%d/%Y').date()
-                return next_date <= datetime.now().date()
-            except ValueError:
-                return False
+            next_date = _parse_mdy(next_contact_value.strip())
+            return next_date is not None and next_date <= today
         
         # Log column detection for debugging
-        logger.info(f"=== COLUMN DETECTION ===")
-        logger.info(f"Headers: {headers}")
-        logger.info(f"School col: {school_col} = '{headers[school_col] if school_col >= 0 else 'NOT FOUND'}'")
-        logger.info(f"OL Name col: {ol_name_col} = '{headers[ol_name_col] if ol_name_col >= 0 else 'NOT FOUND'}'")
-        logger.info(f"RC Name col: {rc_name_col} = '{headers[rc_name_col] if rc_name_col >= 0 else 'NOT FOUND'}'")
-        logger.info(f"OL Email col: {ol_email_col} = '{headers[ol_email_col] if ol_email_col >= 0 else 'NOT FOUND'}'")
-        logger.info(f"RC Email col: {rc_email_col} = '{headers[rc_email_col] if rc_email_col >= 0 else 'NOT FOUND'}'")
-        logger.info(f"OL Contacted col: {ol_contacted_col} = '{headers[ol_contacted_col] if ol_contacted_col >= 0 else 'NOT FOUND'}'")
-        logger.info(f"RC Contacted col: {rc_contacted_col} = '{headers[rc_contacted_col] if rc_contacted_col >= 0 else 'NOT FOUND'}'")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"=== COLUMN DETECTION ===")
+            logger.info(f"Headers: {headers}")
+            logger.info(f"School col: {school_col} = '{headers[school_col] if school_col >= 0 else 'NOT FOUND'}'")
+            logger.info(f"OL Name col: {ol_name_col} = '{headers[ol_name_col] if ol_name_col >= 0 else 'NOT FOUND'}'")
+            logger.info(f"RC Name col: {rc_name_col} = '{headers[rc_name_col] if rc_name_col >= 0 else 'NOT FOUND'}'")
+            logger.info(f"OL Email col: {ol_email_col} = '{headers[ol_email_col] if ol_email_col >= 0 else 'NOT FOUND'}'")
+            logger.info(f"RC Email col: {rc_email_col} = '{headers[rc_email_col] if rc_email_col >= 0 else 'NOT FOUND'}'")
+            logger.info(f"OL Contacted col: {ol_contacted_col} = '{headers[ol_contacted_col] if ol_contacted_col >= 0 else 'NOT FOUND'}'")
+            logger.info(f"RC Contacted col: {rc_contacted_col} = '{headers[rc_contacted_col] if rc_contacted_col >= 0 else 'NOT FOUND'}'")
+        
+        # Column access plan: pad each row to `width` cells plus one blank
+        # slot that stands in for columns that weren't found, then pull the
+        # fields with itemgetter calls instead of a bounds check each.
+        # Rows are screened on school, emails and contacted/next-contact
+        # before the rest is read.
+        key_cols = (school_col, ol_email_col, rc_email_col,
+                    ol_contacted_col, rc_contacted_col, ol_next_col, rc_next_col)
+        detail_cols = (ol_name_col, rc_name_col,
+                       ol_stage_col, rc_stage_col, rc_responded_col, ol_responded_col,
+                       rc_email_status_col, ol_email_status_col)
+        width = max(key_cols + detail_cols) + 1
+        extract_key = itemgetter(*[c if c >= 0 else width for c in key_cols])
+        extract_detail = itemgetter(*[c if c >= 0 else width for c in detail_cols])
+        padding = [''] * (width + 1)
         
         coaches = []
         seen_emails = set()
@@ -512,60 +1015,67 @@ class SmartEmailSender:
         
         for row_idx, row in enumerate(sheet_data):
             try:
-                school = row[school_col].strip() if school_col >= 0 and school_col < len(row) else ''
-                ol_name = row[ol_name_col].strip() if ol_name_col >= 0 and ol_name_col < len(row) else ''
-                rc_name = row[rc_name_col].strip() if rc_name_col >= 0 and rc_name_col < len(row) else ''
-                ol_email_raw = row[ol_email_col] if ol_email_col >= 0 and ol_email_col < len(row) else ''
-                rc_email_raw = row[rc_email_col] if rc_email_col >= 0 and rc_email_col < len(row) else ''
-                ol_contacted_raw = row[ol_contacted_col] if ol_contacted_col >= 0 and ol_contacted_col < len(row) else ''
-                rc_contacted_raw = row[rc_contacted_col] if rc_contacted_col >= 0 and rc_contacted_col < len(row) else ''
+                cells = row[:width]
+                cells += padding[len(cells):]
+                (school, ol_email_raw, rc_email_raw,
+                 ol_contacted_raw, rc_contacted_raw, ol_next_raw, rc_next_raw) = extract_key(cells)
+                school = school.strip()
                 
-                # Skip if no school
-                if not school:
+                # Skip if no school or nothing to send to
+                if not school or not (ol_email_raw or rc_email_raw):
                     continue
                 
                 # Clean and validate emails
-                ol_email = clean_email(ol_email_raw)
-                rc_email = clean_email(rc_email_raw)
-                
+                ol_email = _clean_email(ol_email_raw)
+                rc_email = _clean_email(rc_email_raw)
+
+                # Log any invalid emails for debugging
+                if ol_email_raw and not ol_email:
+                    logger.warning(f"Row {row_idx+2}: Invalid OL email for {school}: '{ol_email_raw}'")
+                    skipped_invalid += 1
+                if rc_email_raw and not rc_email:
+                    logger.warning(f"Row {row_idx+2}: Invalid RC email for {school}: '{rc_email_raw}'")
+                    skipped_invalid += 1
+
+                if not ol_email and not rc_email:
+                    continue
+
                 # Check contacted status
                 ol_contacted = is_contacted(ol_contacted_raw)
                 rc_contacted = is_contacted(rc_contacted_raw)
 
-                # Check follow-up status (due for follow-up?)
-                ol_next_raw = row[ol_next_col] if ol_next_col >= 0 and ol_next_col < len(row) else ''
-                rc_next_raw = row[rc_next_col] if rc_next_col >= 0 and rc_next_col < len(row) else ''
-                ol_stage_raw = row[ol_stage_col] if ol_stage_col >= 0 and ol_stage_col < len(row) else ''
-                rc_stage_raw = row[rc_stage_col] if rc_stage_col >= 0 and rc_stage_col < len(row) else ''
+                # Both roles contacted and no follow-up scheduled: the row is
+                # done. A dual-role row still takes the full path, since it
+                # counts as invalid rather than contacted if marked bad.
+                if (ol_contacted and rc_contacted and not ol_next_raw and not rc_next_raw
+                        and ol_email != rc_email):
+                    skipped_contacted += bool(ol_email) + bool(rc_email)
+                    continue
+
+                # Only candidate rows get their follow-up/status fields parsed
+                (ol_name, rc_name,
+                 ol_stage_raw, rc_stage_raw, rc_responded_raw, ol_responded_raw,
+                 rc_email_status_raw, ol_email_status_raw) = extract_detail(cells)
+                ol_name = ol_name.strip()
+                rc_name = rc_name.strip()
 
                 # Check responded status (skip if responded)
-                rc_responded_raw = row[rc_responded_col] if rc_responded_col >= 0 and rc_responded_col < len(row) else ''
-                ol_responded_raw = row[ol_responded_col] if ol_responded_col >= 0 and ol_responded_col < len(row) else ''
                 rc_responded = has_responded(rc_responded_raw)
                 ol_responded = has_responded(ol_responded_raw)
 
                 # Check email status (skip if marked as wrong/bad)
-                rc_email_status_raw = row[rc_email_status_col] if rc_email_status_col >= 0 and rc_email_status_col < len(row) else ''
-                ol_email_status_raw = row[ol_email_status_col] if ol_email_status_col >= 0 and ol_email_status_col < len(row) else ''
                 rc_bad_email = has_bad_email(rc_email_status_raw)
                 ol_bad_email = has_bad_email(ol_email_status_raw)
 
+                # Check follow-up status (due for follow-up?)
                 ol_due_followup = is_due_for_followup(ol_next_raw)
                 rc_due_followup = is_due_for_followup(rc_next_raw)
                 ol_stage = int(ol_stage_raw) if ol_stage_raw.strip().isdigit() else 0
                 rc_stage = int(rc_stage_raw) if rc_stage_raw.strip().isdigit() else 0
 
                 # Log first few rows for debugging
-                if row_idx < 3:
-                    logger.info(f"Row {row_idx+2}: {school} | OL: {ol_email} (contacted: {ol_contacted}, due: {ol_due_followup}) | RC: {rc_email} (contacted: {rc_contacted}, due: {rc_due_followup})")
-
-                # Log any invalid emails for debugging
-                if ol_email_raw and not ol_email:
-                    logger.warning(f"Row {row_idx+2}: Invalid OL email for {school}: '{ol_email_raw}'")
-                    skipped_invalid += 1
-                if rc_email_raw and not rc_email:
-                    logger.warning(f"Row {row_idx+2}: Invalid RC email for {school}: '{rc_email_raw}'")
-                    skipped_invalid += 1
+                if row_idx < 3 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Row {row_idx+2}: {school} | OL: {ol_email} (contacted: {ol_contacted}, due: {ol_due_followup}) | RC: {rc_email} (contacted: {rc_contacted}, due: {rc_due_followup})")
 
                 # Check if same person (same email for both roles)
                 is_dual_role = ol_email and rc_email and ol_email == rc_email
@@ -661,33 +1171,19 @@ class SmartEmailSender:
         
         Returns (subject, body)
         """
-        # Build template variables
-        variables = {
-            'coach_name': coach.get('last_name', 'Coach'),
-            'school': coach['school'],
-            'athlete_name': self.athlete.name,
-            'position': self.athlete.positions or 'Athlete',
-            'grad_year': self.athlete.graduation_year,
-            'height': self.athlete.height or '',
-            'weight': self.athlete.weight or '',
-            'gpa': self.athlete.gpa or '',
-            'hudl_link': self.athlete.highlight_url or '',
-            'high_school': self.athlete.high_school or '',
-            'city_state': self.athlete.city_state or '',
-            'phone': self.athlete.phone or '',
-            'email': self.athlete.email or '',
-            # Legacy variables for backward compatibility
-            'last_name': coach.get('last_name', 'Coach'),
-            'graduation_year': self.athlete.graduation_year,
-            'positions': self.athlete.positions or '',
-            'highlight_url': self.athlete.highlight_url or '',
-        }
+        # Build template variables: the athlete's are fixed per sender
+        last_name = coach.get('last_name', 'Coach')
+        variables = self._base_variables.copy()
+        variables['coach_name'] = last_name
+        variables['last_name'] = last_name
+        variables['school'] = coach['school']
         
         # Try enterprise randomized templates first
-        if self.config.use_randomized_templates:
+        get_random_template_for_coach = (
+            _get_template_picker() if self.config.use_randomized_templates else None
+        )
+        if get_random_template_for_coach is not None:
             try:
-                from enterprise.templates import get_random_template_for_coach
-                
                 # Determine coach type for template selection
                 coach_type = 'rc' if coach['type'] in ['rc', 'dual'] else 'oc'
                 
@@ -701,8 +1197,6 @@ class SmartEmailSender:
                 logger.debug(f"Using enterprise template: {template.id} for {coach['school']}")
                 return subject, body
                 
-            except ImportError:
-                logger.debug("Enterprise templates not available, using default")
             except Exception as e:
                 logger.warning(f"Error with enterprise templates: {e}, using default")
         
@@ -718,13 +1212,8 @@ class SmartEmailSender:
             subject_template = self.config.rc_subject
         
         # Apply replacements (legacy format)
-        subject = subject_template
-        body = template
-        
-        for key, value in variables.items():
-            subject = subject.replace('{' + key + '}', str(value))
-            body = body.replace('{' + key + '}', str(value))
-            body = body.replace('{' + key + '}', value)
+        subject = _fill_placeholders(subject_template, variables)
+        body = _fill_placeholders(template, variables)
         
         return subject, body
     
@@ -735,30 +1224,34 @@ class SmartEmailSender:
         Returns (success, error_message)
         """
         try:
-            if not self._connection:
-                if not self.connect():
-                    return False, "Not connected to SMTP"
+            if not self._ensure_connection():
+                return False, "Not connected to SMTP"
             
-            msg = MIMEMultipart()
-            msg['From'] = self.config.email_address
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            self._connection.sendmail(
-                self.config.email_address,
-                to_email,
-                msg.as_string()
-            )
-            
-            return True, ""
-            
-        except smtplib.SMTPException as e:
-            self.disconnect()
-            return False, str(e)
+            payload = _build_message(self.config.email_address, to_email, subject, body)
         except Exception as e:
             return False, str(e)
+        
+        # One retry: on a fresh session if the socket broke, on the same
+        # session for a transient 4xx reply
+        for attempt in range(2):
+            try:
+                self._connection.sendmail(self.config.email_address, to_email, payload)
+                self._last_used = time.monotonic()
+                return True, ""
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as e:
+                self._drop_connection()
+                if attempt or not self._reconnect():
+                    return False, str(e)
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code in SMTP_FATAL_CODES:
+                    self.disconnect()
+                    return False, str(e)
+                if attempt or not 400 <= e.smtp_code < 500:
+                    return False, str(e)
+            except Exception as e:
+                # e.g. SMTPRecipientsRefused: smtplib has reset the
+                # transaction and the session is still usable
+                return False, str(e)
     
     def send_to_coaches(
         self,
@@ -790,27 +1283,57 @@ class SmartEmailSender:
                 callback('error', {'message': f'Daily limit reached ({self.config.max_per_day})'})
             return {'sent': 0, 'errors': 0, 'skipped': len(coaches)}
         
-        # Connect
-        if not self.connect():
+        # Connect (or reuse a live session)
+        if not self._ensure_connection():
             if callback:
                 callback('error', {'message': 'Failed to connect to email server'})
             return {'sent': 0, 'errors': 1, 'skipped': len(coaches)}
         
-        import re
         def is_single_valid_email(email):
             """Ensure email is valid and contains only ONE email address"""
             if not email or not isinstance(email, str):
                 return False
             email = email.strip()
-            # Must not contain multiple @ symbols (indicates concatenated emails)
-            if email.count('@') != 1:
-                return False
-            # Must not contain spaces or newlines
-            if ' ' in email or '\n' in email or '\r' in email:
-                return False
-            # Basic format check
-            pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            return bool(re.match(pattern, email)) and len(email) < 100
+            # The anchored pattern admits exactly one @ (no concatenated
+            # emails) and no spaces or newlines, so one match checks it all
+            return len(email) < 100 and _EMAIL_RE.match(email) is not None
+        
+        # Sheet cell writes, sent together instead of one request per cell
+        # written by one background worker so the Sheets round trip overlaps
+        # the next SMTP send; a single worker keeps the writes in order
+        pending_updates = []
+        sheet_writes = []
+        sheet_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheet-writer')
+        
+        def queue_cell(row, col, value):
+            pending_updates.append({'range': _a1(row, col), 'values': [[value]]})
+        
+        def write_batch(batch):
+            # Contacted/next-contact marks keep coaches from being emailed
+            # again, so one bad range or a transient 5xx must not cost the
+            # whole batch: retry once, then fall back to one write per cell
+            for attempt in range(2):
+                try:
+                    sheet.batch_update(batch, value_input_option='USER_ENTERED')
+                    return
+                except Exception as e:
+                    logger.warning(f"Failed to update sheet ({len(batch)} cells, attempt {attempt + 1}): {e}")
+                    if attempt == 0:
+                        time.sleep(SHEET_RETRY_DELAY_SECONDS)
+            for update in batch:
+                try:
+                    sheet.batch_update([update], value_input_option='USER_ENTERED')
+                except Exception as e:
+                    # Logged with its value so the cell can be replayed by hand
+                    logger.error(f"Failed to update sheet cell {update['range']} = {update['values'][0][0]!r}: {e}")
+        
+        def flush_updates(wait_for_writes=False):
+            if pending_updates:
+                sheet_writes.append(sheet_writer.submit(write_batch, pending_updates[:]))
+                pending_updates.clear()
+            if wait_for_writes:
+                wait(sheet_writes)
+                sheet_writes.clear()
         
         try:
             for i, coach in enumerate(coaches):
@@ -836,6 +1359,7 @@ class SmartEmailSender:
                 subject, body = self.prepare_email(coach)
                 
                 # Send
+                send_started = time.monotonic()
                 success, error = self.send_email(email, subject, body)
                 
                 if success:
@@ -848,7 +1372,6 @@ class SmartEmailSender:
                     # Update sheet - mark as contacted AND schedule follow-up
                     if sheet and coach.get('row_idx'):
                         try:
-                            from datetime import timedelta
                             today = date.today()
                             today_str = today.strftime('%m/%d/%Y')
                             next_contact = (today + timedelta(days=3)).strftime('%m/%d/%Y')
@@ -872,26 +1395,28 @@ class SmartEmailSender:
                             if coach['type'] == 'dual':
                                 # Update both RC and OL contacted dates
                                 if coach.get('row_ol_contacted_col'):
-                                    sheet.update_cell(row_num, coach['row_ol_contacted_col'], today_str)
+                                    queue_cell(row_num, coach['row_ol_contacted_col'], today_str)
                                 if coach.get('row_rc_contacted_col'):
-                                    sheet.update_cell(row_num, coach['row_rc_contacted_col'], today_str)
+                                    queue_cell(row_num, coach['row_rc_contacted_col'], today_str)
                                 # Update follow-up tracking for both
-                                sheet.update_cell(row_num, RC_STAGE_COL, str(new_stage))
-                                sheet.update_cell(row_num, RC_NEXT_COL, next_contact)
-                                sheet.update_cell(row_num, OL_STAGE_COL, str(new_stage))
-                                sheet.update_cell(row_num, OL_NEXT_COL, next_contact)
+                                queue_cell(row_num, RC_STAGE_COL, str(new_stage))
+                                queue_cell(row_num, RC_NEXT_COL, next_contact)
+                                queue_cell(row_num, OL_STAGE_COL, str(new_stage))
+                                queue_cell(row_num, OL_NEXT_COL, next_contact)
                             elif coach['type'] == 'rc':
                                 if coach.get('contacted_col'):
-                                    sheet.update_cell(row_num, coach['contacted_col'], today_str)
-                                sheet.update_cell(row_num, RC_STAGE_COL, str(new_stage))
-                                sheet.update_cell(row_num, RC_NEXT_COL, next_contact)
+                                    queue_cell(row_num, coach['contacted_col'], today_str)
+                                queue_cell(row_num, RC_STAGE_COL, str(new_stage))
+                                queue_cell(row_num, RC_NEXT_COL, next_contact)
                             else:  # ol
                                 if coach.get('contacted_col'):
-                                    sheet.update_cell(row_num, coach['contacted_col'], today_str)
-                                sheet.update_cell(row_num, OL_STAGE_COL, str(new_stage))
-                                sheet.update_cell(row_num, OL_NEXT_COL, next_contact)
+                                    queue_cell(row_num, coach['contacted_col'], today_str)
+                                queue_cell(row_num, OL_STAGE_COL, str(new_stage))
+                                queue_cell(row_num, OL_NEXT_COL, next_contact)
 
-                            logger.info(f"Updated sheet: {coach['school']} stage={new_stage}, next={next_contact}")
+                            logger.info(f"Queued sheet update: {coach['school']} stage={new_stage}, next={next_contact}")
+                            if len(pending_updates) >= SHEET_UPDATE_BATCH:
+                                flush_updates()
                         except Exception as e:
                             logger.warning(f"Failed to update sheet: {e}")
                     
@@ -927,6 +1452,8 @@ class SmartEmailSender:
                             if is_blocked:
                                 # We got blocked - delete this row entirely
                                 logger.error(f"BLOCKED sending to {coach['school']} - removing from sheet")
+                                # Queued writes use current row numbers; land them before rows shift
+                                flush_updates(wait_for_writes=True)
                                 sheet.delete_rows(row_num)
                                 if callback:
                                     callback('coach_removed', {
@@ -938,12 +1465,12 @@ class SmartEmailSender:
                                 # Wrong email - mark as "wrong" so scraper will re-scrape
                                 logger.warning(f"Invalid email for {coach['school']} - marking as wrong")
                                 if coach['type'] == 'dual':
-                                    sheet.update_cell(row_num, RC_EMAIL_STATUS_COL, 'wrong')
-                                    sheet.update_cell(row_num, OL_EMAIL_STATUS_COL, 'wrong')
+                                    queue_cell(row_num, RC_EMAIL_STATUS_COL, 'wrong')
+                                    queue_cell(row_num, OL_EMAIL_STATUS_COL, 'wrong')
                                 elif coach['type'] == 'rc':
-                                    sheet.update_cell(row_num, RC_EMAIL_STATUS_COL, 'wrong')
+                                    queue_cell(row_num, RC_EMAIL_STATUS_COL, 'wrong')
                                 else:  # ol
-                                    sheet.update_cell(row_num, OL_EMAIL_STATUS_COL, 'wrong')
+                                    queue_cell(row_num, OL_EMAIL_STATUS_COL, 'wrong')
                         except Exception as e:
                             logger.warning(f"Failed to update sheet for error: {e}")
 
@@ -960,11 +1487,16 @@ class SmartEmailSender:
                         logger.error("Account appears blocked - stopping email sending")
                         break
                 
-                # Delay
+                # Delay, counted from the start of this send so the SMTP round
+                # trip and sheet bookkeeping overlap the pacing gap
                 if i < len(coaches) - 1:
-                    time.sleep(self.config.delay_seconds)
+                    remaining_delay = self.config.delay_seconds - (time.monotonic() - send_started)
+                    if remaining_delay > 0:
+                        time.sleep(remaining_delay)
         
         finally:
+            flush_updates()
+            sheet_writer.shutdown(wait=True)
             self.disconnect()
         
         return {'sent': sent, 'errors': errors, 'skipped': skipped}
@@ -974,13 +1506,23 @@ class SmartEmailSender:
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+_email_tracker = None
+
 def get_email_tracker() -> EmailTracker:
-    """Get email tracker instance."""
-    return EmailTracker()
+    """Get singleton email tracker (one writer per append log)."""
+    global _email_tracker
+    if _email_tracker is None:
+        _email_tracker = EmailTracker()
+    return _email_tracker
+
+_analytics = None
 
 def get_analytics() -> AnalyticsTracker:
-    """Get analytics tracker instance."""
-    return AnalyticsTracker()
+    """Get singleton analytics tracker (its saves are debounced in memory)."""
+    global _analytics
+    if _analytics is None:
+        _analytics = AnalyticsTracker()
+    return _analytics
 
 
 # ============================================================================
@@ -997,16 +1539,29 @@ class GmailResponseChecker:
         self.email_address = email_address
         self.app_password = app_password
         self._connection = None
+        self._last_used = 0.0
     
     def connect(self) -> bool:
-        """Connect to Gmail IMAP"""
+        """Connect to Gmail IMAP, reusing a live session (NOOP-checked after an idle gap)"""
+        import imaplib
+        if self._connection and time.monotonic() - self._last_used > IMAP_IDLE_CHECK_SECONDS:
+            try:
+                self._connection.noop()
+                self._last_used = time.monotonic()
+            except (imaplib.IMAP4.error, OSError):
+                self._connection = None
+        if self._connection:
+            return True
+        
         try:
-            import imaplib
             self._connection = imaplib.IMAP4_SSL('imap.gmail.com')
             self._connection.login(self.email_address, self.app_password)
+            self._last_used = time.monotonic()
             return True
         except Exception as e:
             logger.error(f"IMAP connection failed: {e}")
+            # Never keep a socket that did not get through LOGIN
+            self._connection = None
             return False
     
     def disconnect(self):
@@ -1030,7 +1585,6 @@ class GmailResponseChecker:
             Dict mapping coach_email -> {responded: bool, subject: str, date: str}
         """
         import imaplib
-        import email
         from email.header import decode_header
         from datetime import datetime, timedelta
         
@@ -1043,38 +1597,73 @@ class GmailResponseChecker:
             # Select inbox
             self._connection.select('INBOX')
             
-            # Search for emails since date
+            # Let the server filter by sender instead of pulling the whole inbox
             since_date = (datetime.now() - timedelta(days=since_days)).strftime('%d-%b-%Y')
-            _, message_nums = self._connection.search(None, f'(SINCE {since_date})')
-            
             coach_emails_lower = {e.lower() for e in coach_emails}
+            addresses = sorted(coach_emails_lower)
+            
+            matched = set()
+            for start in range(0, len(addresses), IMAP_SEARCH_BATCH):
+                batch = addresses[start:start + IMAP_SEARCH_BATCH]
+                criteria = f'(SINCE {since_date} {self._build_from_criteria(batch)})'
+                _, message_nums = self._connection.search(None, criteria)
+                matched.update(message_nums[0].split())
+            
+            # Newest first, so the first reply seen from a coach is the latest one
+            nums = sorted(matched, key=int, reverse=True)
+            
+            def fetch_headers():
+                # One FETCH per batch instead of a round trip per message; batches
+                # are fetched lazily so stopping early skips the older ones
+                for start in range(0, len(nums), IMAP_FETCH_BATCH):
+                    try:
+                        _, msg_data = self._connection.fetch(
+                            b','.join(nums[start:start + IMAP_FETCH_BATCH]), _IMAP_FETCH_ITEMS)
+                    except imaplib.IMAP4.abort:
+                        raise
+                    except imaplib.IMAP4.error as e:
+                        logger.debug(f"Error fetching emails: {e}")
+                        continue
+                    # One (b'N (BODY[...] {size}', header_bytes) tuple per message,
+                    # each followed by a b')' line; servers answer in ascending order
+                    parts = [part for part in msg_data if isinstance(part, tuple)]
+                    parts.sort(key=lambda part: int(part[0].split(None, 1)[0]), reverse=True)
+                    for part in parts:
+                        yield part[1]
             
-            for num in message_nums[0].split():
+            # Coaches with no reply found yet; the scan stops once it is empty
+            remaining = {e.encode() for e in coach_emails_lower}
+            # Bound once; these run for every fetched message
+            find_from_line = _FROM_LINE_RE.search
+            find_address = _FROM_ADDR_RE.search
+            
+            for email_body in fetch_headers():
                 try:
-                    _, msg_data = self._connection.fetch(num, '(RFC822)')
-                    email_body = msg_data[0][1]
-                    msg = email.message_from_bytes(email_body)
-                    
-                    # Get sender email
-                    from_header = msg['From']
-                    if '<' in from_header:
-                        sender_email = from_header.split('<')[1].split('>')[0].lower()
-                    else:
-                        sender_email = from_header.lower()
+                    # Get sender email straight from the raw bytes
+                    match = find_from_line(email_body)
+                    if not match:
+                        continue
+                    from_header = match.group(1).rstrip()
+                    addr = find_address(from_header)
+                    sender = (addr.group(1) if addr else from_header).lower()
                     
-                    # Check if from a coach we emailed
-                    if sender_email in coach_emails_lower:
+                    # Check if from a coach still unanswered before decoding anything else
+                    if sender in remaining:
+                        sender_email = sender.decode()
+                        msg = _HEADER_PARSER.parsebytes(email_body)
+                        
                         # Get subject
                         subject = msg['Subject'] or ''
                         if isinstance(subject, bytes):
                             subject = subject.decode()
                         
-                        # Decode if needed
-                        decoded = decode_header(subject)
-                        if decoded:
-                            subject = decoded[0][0]
-                            if isinstance(subject, bytes):
-                                subject = subject.decode()
+                        # Decode if needed; plain subjects have no encoded-word marker
+                        if '=?' in subject:
+                            decoded = decode_header(subject)
+                            if decoded:
+                                subject = decoded[0][0]
+                                if isinstance(subject, bytes):
+                                    subject = subject.decode()
                         
                         # Get date
                         date_str = msg['Date'] or ''
@@ -1085,24 +1674,40 @@ class GmailResponseChecker:
                             'date': date_str[:30]
                         }
                         
+                        remaining.discard(sender)
+                        if not remaining:
+                            break
+                        
                 except Exception as e:
                     logger.debug(f"Error processing email: {e}")
                     continue
+            
+            self._last_used = time.monotonic()
         
         except Exception as e:
+            # Session state is unknown; log out so the next check starts clean
             logger.error(f"Error checking responses: {e}")
-        
-        finally:
             self.disconnect()
         
         return results
     
+    @staticmethod
+    def _build_from_criteria(addresses: List[str]) -> str:
+        """Build a prefix-notation OR chain: OR OR FROM "a" FROM "b" FROM "c"."""
+        clauses = ' '.join(f'FROM "{address}"' for address in addresses)
+        return 'OR ' * (len(addresses) - 1) + clauses
+    
     def get_response_count(self, coach_emails: List[str], since_days: int = 30) -> int:
         """Quick count of how many coaches have responded"""
         results = self.check_for_responses(coach_emails, since_days)
         return sum(1 for r in results.values() if r['responded'])
 
 
+# One logged-in IMAP checker per Gmail account, kept between calls
+_response_checkers: Dict[str, GmailResponseChecker] = {}
+_response_checkers_lock = threading.Lock()
+
+
 def check_gmail_responses(email_address: str, app_password: str, coach_emails: List[str]) -> Dict[str, Dict]:
     """
     Convenience function to check for responses.
@@ -1113,5 +1718,19 @@ def check_gmail_responses(email_address: str, app_password: str, coach_emails: L
             if info['responded']:
                 print(f"{email} responded on {info['date']}: {info['subject']}")
     """
-    checker = GmailResponseChecker(email_address, app_password)
-    return checker.check_for_responses(coach_emails)
+    key = email_address.lower().strip()
+    with _response_checkers_lock:
+        # Checked out while in use so concurrent calls never share a session
+        checker = _response_checkers.pop(key, None)
+    if checker is None or checker.app_password != app_password:
+        if checker:
+            checker.disconnect()
+        checker = GmailResponseChecker(email_address, app_password)
+    
+    try:
+        return checker.check_for_responses(coach_emails)
+    finally:
+        with _response_checkers_lock:
+            idle = _response_checkers.setdefault(key, checker)
+        if idle is not checker:
+            checker.disconnect()
@@ -26,13 +26,58 @@ import json
 import time
 import random
 import logging
-from typing import Optional, Dict, List, Any, Callable
+import threading
+from typing import Optional, Dict, List, Set, Any, Callable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, date
 from pathlib import Path
 
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+    HAS_SELENIUM = True
+except ImportError:
+    HAS_SELENIUM = False
+
 logger = logging.getLogger(__name__)
 
+# Worksheet shared by every tracker; authorizing and opening the
+# spreadsheet costs several HTTP round trips, so it is done once.
+# When opened from the local credentials file, that file's mtime is kept
+# so an edited key is picked up without a restart.
+_worksheet = None
+_worksheet_mtime = None
+_worksheet_lock = threading.Lock()
+
+CREDENTIALS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'credentials.json')
+
+# Sheet columns read by the DM tracker, matched by substring. Status columns
+# come first so 'rc twitter status' is never taken for the handle column.
+_DM_COLUMN_ALIASES = (
+    ('rc_twitter_status', ('rc twitter status',)),
+    ('ol_twitter_status', ('ol twitter status',)),
+    ('rc_twitter', ('rc twitter',)),
+    ('ol_twitter', ('ol twitter', 'oc twitter')),
+)
+
+# Requests the DM flow never needs: ad/analytics beacons and profile videos.
+# Blocked in the browser to cut page-load traffic per DM.
+BLOCKED_URL_PATTERNS = [
+    '*ads-twitter.com*',
+    '*analytics.twitter.com*',
+    '*doubleclick.net*',
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*video.twimg.com*',
+]
+
+# {variable} placeholders in DM templates
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
 
 # ============================================================================
 # CONFIGURATION
@@ -78,26 +123,43 @@ class TwitterDMTracker:
 
     def __init__(self, storage_path: str = None):
         # NO LOCAL STORAGE - everything via Google Sheets
+        # Every handle already messaged; full records only for DMs sent by this process
+        self._sent_handles: Set[str] = set()
         self.sent_dms: Dict[str, DMRecord] = {}
         self.daily_count: int = 0
         self.last_reset_date: str = ""
         self._load_from_sheets()
 
     def _get_sheet(self):
-        """Get Google Sheets connection."""
+        """Get Google Sheets connection (opened once per process)."""
+        global _worksheet, _worksheet_mtime
+        mtime = None
+        if not os.environ.get('GOOGLE_CREDENTIALS'):
+            try:
+                mtime = os.stat(CREDENTIALS_FILE).st_mtime
+            except OSError:
+                pass
+        if _worksheet is not None and mtime == _worksheet_mtime:
+            return _worksheet
+
+        with _worksheet_lock:
+            if _worksheet is None or mtime != _worksheet_mtime:
+                _worksheet = self._open_sheet()
+                _worksheet_mtime = mtime
+            return _worksheet
+
+    def _open_sheet(self):
+        """Authorize with Google and open the tracking worksheet."""
         try:
             import gspread
-            import os
-            import tempfile
             from google.oauth2.service_account import Credentials
 
+            scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
             google_creds = os.environ.get('GOOGLE_CREDENTIALS', '')
             if not google_creds:
                 # Try local credentials
-                creds_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'credentials.json')
-                if os.path.exists(creds_file):
-                    scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-                    creds = Credentials.from_service_account_file(creds_file, scopes=scope)
+                if os.path.exists(CREDENTIALS_FILE):
+                    creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=scope)
                     client = gspread.authorize(creds)
                     return client.open('bardeen').sheet1
                 return None
@@ -107,12 +169,8 @@ class TwitterDMTracker:
                 creds_str = creds_str[1:-1]
             creds_str = creds_str.replace('\\\\n', '\\n')
 
-            temp_creds = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-            temp_creds.write(creds_str)
-            temp_creds.close()
-
-            scope = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-            creds = Credentials.from_service_account_file(temp_creds.name, scopes=scope)
+            # Parsed in memory instead of round-tripping through a temp file
+            creds = Credentials.from_service_account_info(json.loads(creds_str), scopes=scope)
             client = gspread.authorize(creds)
             return client.open('bardeen').sheet1
         except Exception as e:
@@ -130,42 +188,37 @@ class TwitterDMTracker:
             if len(all_data) < 2:
                 return
 
-            headers = [h.lower().strip() for h in all_data[0]]
-
-            def find_col(keywords):
-                for i, h in enumerate(headers):
-                    for kw in keywords:
-                        if kw in h:
-                            return i
-                return -1
-
-            rc_twitter_status = find_col(['rc twitter status'])
-            ol_twitter_status = find_col(['ol twitter status'])
-            rc_twitter = find_col(['rc twitter'])
-            ol_twitter = find_col(['ol twitter', 'oc twitter'])
-
+            # One pass over the headers; each header is claimed by the first
+            # matching column and the leftmost header wins
+            cols = {}
+            for i, h in enumerate(all_data[0]):
+                h = h.lower().strip()
+                for key, aliases in _DM_COLUMN_ALIASES:
+                    if any(a in h for a in aliases):
+                        cols.setdefault(key, i)
+                        break
+
+            rc_twitter_status = cols.get('rc_twitter_status', -1)
+            ol_twitter_status = cols.get('ol_twitter_status', -1)
+            rc_twitter = cols.get('rc_twitter', -1)
+            ol_twitter = cols.get('ol_twitter', -1)
+
+            # (handle, status) column pairs for RC and OL twitter
+            pairs = [(handle_col, status_col) for handle_col, status_col in
+                     ((rc_twitter, rc_twitter_status), (ol_twitter, ol_twitter_status))
+                     if handle_col >= 0 and status_col >= 0]
+
+            # Only the handles are kept; the sheet has no send details to load
+            sent_handles = self._sent_handles
             for row in all_data[1:]:
-                # Check RC twitter
-                if rc_twitter >= 0 and rc_twitter_status >= 0:
-                    handle = row[rc_twitter] if rc_twitter < len(row) else ''
-                    status = row[rc_twitter_status] if rc_twitter_status < len(row) else ''
-                    if handle and 'messaged' in status.lower():
-                        self.sent_dms[handle.lower()] = DMRecord(
-                            handle=handle, school='', sent_at=datetime.now().isoformat(),
-                            message_preview=''
-                        )
-
-                # Check OL twitter
-                if ol_twitter >= 0 and ol_twitter_status >= 0:
-                    handle = row[ol_twitter] if ol_twitter < len(row) else ''
-                    status = row[ol_twitter_status] if ol_twitter_status < len(row) else ''
-                    if handle and 'messaged' in status.lower():
-                        self.sent_dms[handle.lower()] = DMRecord(
-                            handle=handle, school='', sent_at=datetime.now().isoformat(),
-                            message_preview=''
-                        )
-
-            logger.info(f"Loaded {len(self.sent_dms)} sent DMs from Sheets")
+                width = len(row)
+                for handle_col, status_col in pairs:
+                    if handle_col < width and status_col < width and 'messaged' in row[status_col].lower():
+                        handle = row[handle_col].strip().lower().lstrip('@')
+                        if handle:
+                            sent_handles.add(handle)
+
+            logger.info(f"Loaded {len(sent_handles)} sent DMs from Sheets")
 
         except Exception as e:
             logger.error(f"Error loading from sheets: {e}")
@@ -183,11 +236,12 @@ class TwitterDMTracker:
     def has_sent_to(self, handle: str) -> bool:
         """Check if we've already DM'd this handle."""
         handle = handle.lower().lstrip('@')
-        return handle in self.sent_dms
+        return handle in self._sent_handles
     
     def mark_sent(self, handle: str, school: str, coach_name: str, message: str):
         """Mark a DM as sent."""
         handle = handle.lower().lstrip('@')
+        self._sent_handles.add(handle)
         self.sent_dms[handle] = DMRecord(
             handle=handle,
             school=school,
@@ -207,9 +261,22 @@ class TwitterDMTracker:
             self._save()
         return self.daily_count
     
+    def get_sent_count(self) -> int:
+        """Get number of handles ever DM'd, including those loaded from Sheets."""
+        return len(self._sent_handles)
+    
     def get_sent_list(self) -> List[DMRecord]:
-        """Get list of all sent DMs."""
-        return list(self.sent_dms.values())
+        """
+        Get list of all sent DMs.
+        
+        Handles known only from Sheets come first as stub records (no
+        school, time or preview), followed by DMs sent by this process.
+        """
+        stubs = [
+            DMRecord(handle=handle, school='', coach_name='', sent_at='', message_preview='')
+            for handle in self._sent_handles if handle not in self.sent_dms
+        ]
+        return stubs + list(self.sent_dms.values())
 
 
 # ============================================================================
@@ -226,19 +293,29 @@ class TwitterDMSender:
     - Human-like behavior
     """
     
+    # Element locators; 'xpath' and 'css selector' are By.XPATH and
+    # By.CSS_SELECTOR, spelled out so the class still imports when selenium
+    # is not installed
+    _LOC_LOGGED_IN = ('css selector', "a[data-testid='SideNav_NewTweet_Button'], a[href='/compose/post']")
+    _LOC_MSG_BTN = ('xpath', "//button[@data-testid='sendDMFromProfile']")
+    _LOC_INPUT = ('xpath', "//div[@data-testid='dmComposerTextInput']")
+    _LOC_INPUT_FALLBACK = ('xpath', "//div[@role='textbox']")
+    _LOC_SEND = ('xpath', "//button[@data-testid='dmComposerSendButton']")
+    
     def __init__(self, config: TwitterConfig = None):
         self.config = config or TwitterConfig()
         self.tracker = TwitterDMTracker()
         self.driver = None
         self.logged_in = False
+        self._next_send_at = 0.0  # time.monotonic() before which no DM goes out
     
     def start_browser(self) -> bool:
         """Start the browser for Twitter automation."""
+        if not HAS_SELENIUM:
+            logger.error("Selenium not installed. Run: pip install selenium")
+            return False
+        
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            
             options = Options()
             
             # Use profile directory to persist cookies/login
@@ -255,18 +332,26 @@ class TwitterDMSender:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             options.add_argument("--window-size=1200,800")
+            # /dev/shm is tiny in containers; use /tmp instead of crashing tabs
+            options.add_argument("--disable-dev-shm-usage")
             
             if self.config.headless:
                 options.add_argument("--headless")
+                options.add_argument("--disable-gpu")
             
             self.driver = webdriver.Chrome(options=options)
+            # Explicit waits only; an implicit wait would stack on top of them
+            self.driver.implicitly_wait(0)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.debug(f"Could not block tracking requests: {e}")
+            
             return True
             
-        except ImportError:
-            logger.error("Selenium not installed. Run: pip install selenium")
-            return False
         except Exception as e:
             logger.error(f"Failed to start browser: {e}")
             return False
@@ -304,28 +389,33 @@ class TwitterDMSender:
             return False
         
         try:
-            # Navigate to home and check for login indicators
+            # Navigate to home and wait for either a login redirect or the
+            # compose button instead of a fixed sleep
             self.driver.get("https://twitter.com/home")
-            time.sleep(3)
+            try:
+                self._wait(lambda d: "login" in d.current_url.lower()
+                           or d.find_elements(*self._LOC_LOGGED_IN))
+            except TimeoutException:
+                pass
             
             # Check URL - if redirected to login, not logged in
             if "login" in self.driver.current_url.lower():
                 self.logged_in = False
                 return False
             
-            # Check for compose tweet button or other logged-in indicators
-            page_source = self.driver.page_source.lower()
-            if "compose" in page_source or "what is happening" in page_source or "post" in page_source:
-                self.logged_in = True
-                return True
-            
-            self.logged_in = False
-            return False
+            # Check for the compose button in the browser instead of pulling
+            # and lowercasing the whole page source
+            self.logged_in = bool(self.driver.find_elements(*self._LOC_LOGGED_IN))
+            return self.logged_in
             
         except Exception as e:
             logger.error(f"Error checking login status: {e}")
             return False
     
+    def _wait(self, condition, timeout: float = 10):
+        """Wait until condition(driver) is truthy; raises TimeoutException."""
+        return WebDriverWait(self.driver, timeout).until(condition)
+    
     def wait_for_login(self, timeout: int = 300) -> bool:
         """
         Wait for user to complete manual login.
@@ -336,16 +426,25 @@ class TwitterDMSender:
         Returns:
             True if login successful
         """
-        start_time = time.time()
+        if not self.driver:
+            return False
         
-        while time.time() - start_time < timeout:
-            if self.check_logged_in():
-                logger.info("Successfully logged into Twitter")
-                return True
-            time.sleep(5)
+        # Poll the page the user is logging in on rather than navigating to
+        # /home every few seconds; Twitter lands on /home once login completes
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.5).until(
+                lambda d: "login" not in d.current_url.lower() and d.find_elements(*self._LOC_LOGGED_IN)
+            )
+        except TimeoutException:
+            logger.warning("Login timeout")
+            return False
+        except Exception as e:
+            logger.error(f"Error waiting for login: {e}")
+            return False
         
-        logger.warning("Login timeout")
-        return False
+        self.logged_in = True
+        logger.info("Successfully logged into Twitter")
+        return True
     
     def send_dm(
         self, 
@@ -392,57 +491,72 @@ class TwitterDMSender:
             }
         
         try:
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.common.keys import Keys
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
-            # Navigate to DM page for this user
-            dm_url = f"https://twitter.com/messages/compose?recipient_id={handle}"
-            # Alternative: go to user profile and click message
+            # Each step below waits on the element it needs next rather than
+            # sleeping; the waits return as soon as the page is ready
+            
+            # Go to the user profile and click message. The compose URL
+            # takes a numeric recipient_id, which only the profile reveals.
             profile_url = f"https://twitter.com/{handle}"
             
             self.driver.get(profile_url)
-            time.sleep(3)
             
             # Look for message button
             try:
                 # Try to find message/DM button
                 message_btn = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[@data-testid='sendDMFromProfile']"))
+                    EC.element_to_be_clickable(self._LOC_MSG_BTN)
                 )
                 message_btn.click()
-                time.sleep(2)
             except:
                 # Try alternative method - direct DM URL
                 self.driver.get(f"https://twitter.com/messages/{handle}")
-                time.sleep(3)
             
-            # Find message input
+            # Find message input; one wait accepts either selector, so a
+            # missing testid no longer costs a full timeout before the fallback
             try:
-                msg_input = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, "//div[@data-testid='dmComposerTextInput']"))
-                )
-            except:
-                # Try alternative selector
-                msg_input = self.driver.find_element(By.XPATH, "//div[@role='textbox']")
-            
-            # Type message (human-like)
-            for char in message:
-                msg_input.send_keys(char)
-                time.sleep(random.uniform(0.02, 0.08))
-            
-            time.sleep(1)
+                msg_input = self._wait(
+                    lambda d: d.find_elements(*self._LOC_INPUT) or d.find_elements(*self._LOC_INPUT_FALLBACK)
+                )[0]
+            except TimeoutException:
+                return {
+                    'success': False,
+                    'error': 'DM composer not found (DMs may be closed)',
+                    'handle': handle
+                }
+            
+            # Insert the whole message in one command instead of one
+            # send_keys round trip (and sleep) per character; pacing between
+            # DMs is what keeps us under Twitter's limits
+            self.driver.execute_script(
+                "arguments[0].focus();"
+                "document.execCommand('insertText', false, arguments[1]);",
+                msg_input, message
+            )
+            if not msg_input.text.strip():
+                # Editor ignored insertText; fall back to a single send_keys
+                msg_input.send_keys(message)
             
-            # Send message
+            # Send message once the button is enabled
             try:
-                send_btn = self.driver.find_element(By.XPATH, "//button[@data-testid='dmComposerSendButton']")
+                send_btn = WebDriverWait(self.driver, 5).until(
+                    EC.element_to_be_clickable(self._LOC_SEND)
+                )
                 send_btn.click()
             except:
                 # Try pressing Enter
                 msg_input.send_keys(Keys.RETURN)
             
-            time.sleep(2)
+            # The composer empties (or is re-rendered) once the DM is sent
+            def composer_cleared(driver):
+                try:
+                    return not msg_input.text.strip()
+                except StaleElementReferenceException:
+                    return True
+            
+            try:
+                self._wait(composer_cleared)
+            except TimeoutException:
+                logger.warning(f"DM composer for @{handle} did not clear; assuming sent")
             
             # Mark as sent (local tracker for session)
             self.tracker.mark_sent(handle, school, coach_name, message)
@@ -483,28 +597,76 @@ class TwitterDMSender:
         Returns:
             Formatted message
         """
-        message = template
-        
         # Standard substitutions
-        replacements = {
-            '{last_name}': coach_last_name,
-            '{school}': school,
-            '{athlete_name}': athlete_info.get('name', ''),
-            '{graduation_year}': athlete_info.get('graduation_year', ''),
-            '{height}': athlete_info.get('height', ''),
-            '{weight}': athlete_info.get('weight', ''),
-            '{positions}': athlete_info.get('positions', ''),
-            '{high_school}': athlete_info.get('high_school', ''),
-            '{city_state}': athlete_info.get('city_state', ''),
-            '{highlight_url}': athlete_info.get('highlight_url', ''),
-            '{gpa}': athlete_info.get('gpa', ''),
-            '{phone}': athlete_info.get('phone', ''),
+        replacements = self._athlete_replacements(athlete_info)
+        replacements['last_name'] = coach_last_name
+        replacements['school'] = school
+        
+        # One pass over the template; unknown {placeholders} are left as written
+        return _PLACEHOLDER_RE.sub(
+            lambda m: str(replacements[m.group(1)]) if m.group(1) in replacements else m.group(0),
+            template,
+        )
+    
+    @staticmethod
+    def _athlete_replacements(athlete_info: Dict[str, str]) -> Dict[str, Any]:
+        """Template values that depend only on the athlete."""
+        return {
+            'athlete_name': athlete_info.get('name', ''),
+            'graduation_year': athlete_info.get('graduation_year', ''),
+            'height': athlete_info.get('height', ''),
+            'weight': athlete_info.get('weight', ''),
+            'positions': athlete_info.get('positions', ''),
+            'high_school': athlete_info.get('high_school', ''),
+            'city_state': athlete_info.get('city_state', ''),
+            'highlight_url': athlete_info.get('highlight_url', ''),
+            'gpa': athlete_info.get('gpa', ''),
+            'phone': athlete_info.get('phone', ''),
         }
+    
+    def _message_renderer(self, template: str, athlete_info: Dict[str, str]) -> Callable[[str, str], str]:
+        """
+        Fill a template's athlete fields once for a whole batch.
         
-        for var, value in replacements.items():
-            message = message.replace(var, str(value))
+        Returns render(coach_last_name, school), which gives the same text
+        as prepare_message but only fills the two per-coach fields.
+        """
+        athlete = self._athlete_replacements(athlete_info)
+        # Text at even indexes, placeholder names at odd ones
+        pieces = _PLACEHOLDER_RE.split(template)
+        slots = []
+        for i in range(1, len(pieces), 2):
+            key = pieces[i]
+            if key in athlete:
+                pieces[i] = str(athlete[key])
+            elif key == 'last_name' or key == 'school':
+                slots.append((i, key == 'school'))
+            else:
+                pieces[i] = '{' + key + '}'
         
-        return message
+        def render(coach_last_name: str, school: str) -> str:
+            message = pieces[:]
+            for i, is_school in slots:
+                message[i] = str(school if is_school else coach_last_name)
+            return ''.join(message)
+        
+        return render
+    
+    def _wait_for_send_slot(self):
+        """
+        Sleep until the next DM may go out, then book the one after it.
+        
+        The random gap is counted from the start of each send, so time spent
+        driving the browser is part of the gap instead of added to it, and
+        nothing is slept after the last DM of a batch.
+        """
+        wait = self._next_send_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_send_at = time.monotonic() + random.uniform(
+            self.config.min_delay_seconds,
+            self.config.max_delay_seconds
+        )
     
     def send_to_coaches(
         self,
@@ -529,6 +691,9 @@ class TwitterDMSender:
         errors = 0
         skipped = 0
         
+        # Athlete fields are the same for every coach; fill them once
+        render_message = self._message_renderer(template, athlete_info)
+        
         for i, coach in enumerate(coaches):
             handle = coach.get('handle', '').lstrip('@')
             if not handle:
@@ -536,9 +701,10 @@ class TwitterDMSender:
                 continue
             
             # Check daily limit
-            if self.tracker.get_daily_count() >= self.config.max_dms_per_day:
+            daily_count = self.tracker.get_daily_count()
+            if daily_count >= self.config.max_dms_per_day:
                 if callback:
-                    callback('limit_reached', {'daily_count': self.tracker.get_daily_count()})
+                    callback('limit_reached', {'daily_count': daily_count})
                 break
             
             # Check if already sent
@@ -547,8 +713,11 @@ class TwitterDMSender:
                 continue
             
             # Prepare message
-            last_name = coach.get('name', '').split()[-1] if coach.get('name') else ''
-            message = self.prepare_message(template, last_name, coach.get('school', ''), athlete_info)
+            name_parts = (coach.get('name') or '').split()
+            last_name = name_parts[-1] if name_parts else ''
+            message = render_message(last_name, coach.get('school', ''))
+            
+            self._wait_for_send_slot()
             
             if callback:
                 callback('sending', {
@@ -574,13 +743,6 @@ class TwitterDMSender:
                 errors += 1
                 if callback:
                     callback('error', result)
-            
-            # Delay between messages
-            delay = random.uniform(
-                self.config.min_delay_seconds,
-                self.config.max_delay_seconds
-            )
-            time.sleep(delay)
         
         return {
             'sent': sent,
@@ -591,12 +753,13 @@ class TwitterDMSender:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get DM sending statistics."""
-        sent_list = self.tracker.get_sent_list()
+        sent_list = list(self.tracker.sent_dms.values())
+        daily_count = self.tracker.get_daily_count()
         return {
-            'total_sent': len(sent_list),
-            'sent_today': self.tracker.get_daily_count(),
+            'total_sent': self.tracker.get_sent_count(),
+            'sent_today': daily_count,
             'daily_limit': self.config.max_dms_per_day,
-            'remaining_today': max(0, self.config.max_dms_per_day - self.tracker.get_daily_count()),
+            'remaining_today': max(0, self.config.max_dms_per_day - daily_count),
             'recent': [asdict(dm) for dm in sent_list[-10:]]  # Last 10
         }
 
@@ -632,6 +795,9 @@ class TwitterDMSender:
         coaches = sheets_manager.get_coaches_for_twitter()
         logger.info(f"Found {len(coaches)} coaches to message on Twitter")
 
+        # Athlete fields are the same for every coach; fill them once
+        render_message = self._message_renderer(template, athlete_info)
+
         for i, coach in enumerate(coaches):
             handle = coach.get('handle', '').lstrip('@')
             if not handle:
@@ -639,9 +805,10 @@ class TwitterDMSender:
                 continue
 
             # Check daily limit
-            if self.tracker.get_daily_count() >= self.config.max_dms_per_day:
+            daily_count = self.tracker.get_daily_count()
+            if daily_count >= self.config.max_dms_per_day:
                 if callback:
-                    callback('limit_reached', {'daily_count': self.tracker.get_daily_count()})
+                    callback('limit_reached', {'daily_count': daily_count})
                 break
 
             # Also check local tracker (for this session)
@@ -650,8 +817,11 @@ class TwitterDMSender:
                 continue
 
             # Prepare message
-            last_name = coach.get('name', '').split()[-1] if coach.get('name') else ''
-            message = self.prepare_message(template, last_name, coach.get('school', ''), athlete_info)
+            name_parts = (coach.get('name') or '').split()
+            last_name = name_parts[-1] if name_parts else ''
+            message = render_message(last_name, coach.get('school', ''))
+
+            self._wait_for_send_slot()
 
             if callback:
                 callback('sending', {
@@ -690,13 +860,6 @@ class TwitterDMSender:
                 if callback:
                     callback('error', result)
 
-            # Delay between messages
-            delay = random.uniform(
-                self.config.min_delay_seconds,
-                self.config.max_delay_seconds
-            )
-            time.sleep(delay)
-
         return {
             'sent': sent,
             'errors': errors,
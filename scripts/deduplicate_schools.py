@@ -60,27 +60,28 @@ def get_sheet():
 
 
 def count_non_empty(row):
-    """Count non-empty cells in a row."""
-    return sum(1 for cell in row if cell and str(cell).strip())
+    """Count non-empty cells in a row (get_all_values cells are always str)."""
+    return sum(1 for cell in row if cell.strip())
 
 
-def has_contacted_data(row, headers):
+def find_contacted_cols(headers):
+    """Return (rc_contacted_idx, ol_contacted_idx); None where a column is missing."""
+    rc_contacted_idx = None
+    ol_contacted_idx = None
+    for i, h in enumerate(headers):
+        h_lower = h.lower()
+        if 'rc contacted' in h_lower:
+            rc_contacted_idx = i
+        elif 'ol contacted' in h_lower:
+            ol_contacted_idx = i
+    return rc_contacted_idx, ol_contacted_idx
+
+
+def has_contacted_data(row, rc_contacted_idx, ol_contacted_idx):
     """Check if row has been contacted (more valuable to keep)."""
-    try:
-        rc_contacted_idx = None
-        ol_contacted_idx = None
-        for i, h in enumerate(headers):
-            h_lower = h.lower()
-            if 'rc contacted' in h_lower:
-                rc_contacted_idx = i
-            elif 'ol contacted' in h_lower:
-                ol_contacted_idx = i
-
-        has_rc = rc_contacted_idx is not None and rc_contacted_idx < len(row) and row[rc_contacted_idx].strip()
-        has_ol = ol_contacted_idx is not None and ol_contacted_idx < len(row) and row[ol_contacted_idx].strip()
-        return has_rc or has_ol
-    except:
-        return False
+    has_rc = rc_contacted_idx is not None and rc_contacted_idx < len(row) and row[rc_contacted_idx].strip()
+    has_ol = ol_contacted_idx is not None and ol_contacted_idx < len(row) and row[ol_contacted_idx].strip()
+    return bool(has_rc or has_ol)
 
 
 def main():
@@ -115,24 +116,35 @@ def main():
         print("Error: No 'School' column found")
         return
 
-    # Group rows by school name (normalized)
-    schools = {}
+    # Contacted columns are the same for every row; find them once
+    rc_contacted_idx, ol_contacted_idx = find_contacted_cols(headers)
+
+    # Group rows by school name (normalized) in one pass. Only the first row
+    # of each school is remembered until a second one turns up, so unique
+    # schools (most of the sheet) never get a group or a score.
+    first_seen = {}
+    groups = {}
     for row_idx, row in enumerate(rows):
         school_name = row[school_col].strip().lower() if school_col < len(row) else ''
         if not school_name:
             continue
 
-        if school_name not in schools:
-            schools[school_name] = []
-        schools[school_name].append({
+        first_idx = first_seen.setdefault(school_name, row_idx)
+        if first_idx != row_idx:
+            group = groups.get(school_name)
+            if group is None:
+                groups[school_name] = [first_idx, row_idx]
+            else:
+                group.append(row_idx)
+
+    # Score only the rows that have duplicates, listed in sheet order
+    duplicates = {}
+    for school_name, row_idxs in sorted(groups.items(), key=lambda item: item[1][0]):
+        duplicates[school_name] = [{
             'row_idx': row_idx + 2,  # 1-indexed, +1 for header
-            'data': row,
-            'non_empty_count': count_non_empty(row),
-            'has_contacted': has_contacted_data(row, headers)
-        })
-
-    # Find duplicates
-    duplicates = {name: rows for name, rows in schools.items() if len(rows) > 1}
+            'non_empty_count': count_non_empty(rows[row_idx]),
+            'has_contacted': has_contacted_data(rows[row_idx], rc_contacted_idx, ol_contacted_idx)
+        } for row_idx in row_idxs]
 
     if not duplicates:
         print("\nNo duplicate schools found!")
@@ -172,13 +184,35 @@ def main():
     # Delete rows in reverse order (to avoid index shifting)
     rows_to_delete.sort(reverse=True)
 
+    # Merge runs of adjacent rows into (first, last) ranges, still bottom-up
+    ranges = []
+    for row_idx in rows_to_delete:
+        if ranges and ranges[-1][0] == row_idx + 1:
+            ranges[-1][0] = row_idx
+        else:
+            ranges.append([row_idx, row_idx])
+
+    # One batchUpdate instead of an API call per row; requests are applied
+    # in order, so the reverse sort still keeps earlier indices valid
+    requests = [{
+        'deleteDimension': {
+            'range': {
+                'sheetId': sheet.id,
+                'dimension': 'ROWS',
+                'startIndex': first - 1,  # 0-indexed, end exclusive
+                'endIndex': last,
+            }
+        }
+    } for first, last in ranges]
+
     print("\nDeleting rows...")
+    try:
+        sheet.spreadsheet.batch_update({'requests': requests})
+    except Exception as e:
+        print(f"  Error deleting rows: {e}")
+        return
     for row_idx in rows_to_delete:
-        try:
-            sheet.delete_rows(row_idx)
-            print(f"  Deleted row {row_idx}")
-        except Exception as e:
-            print(f"  Error deleting row {row_idx}: {e}")
+        print(f"  Deleted row {row_idx}")
 
     print("\nDone!")
     print(f"Removed {len(rows_to_delete)} duplicate rows.")
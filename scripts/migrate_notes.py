@@ -18,13 +18,15 @@ Version: 1.0.0
 import re
 import sys
 import os
-import time
+from collections import Counter
 from datetime import datetime
+from itertools import islice
+from functools import lru_cache
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sheets.manager import SheetsManager, SheetsConfig
+from sheets.manager import SheetsManager, SheetsConfig, retry_on_error
 
 
 # New column indices (0-indexed) - UPDATE THESE IF YOUR SHEET IS DIFFERENT
@@ -41,6 +43,10 @@ NEW_COLUMNS = {
     'ol_email_status': 21,   # V
 }
 
+# Cells per batch_update call - Sheets counts each call as one write request
+# against the 60 writes/min quota, however many cells it carries
+WRITE_BATCH_SIZE = 200
+
 # Patterns to extract from notes
 PATTERNS = {
     'responded': [
@@ -72,71 +78,99 @@ PATTERNS = {
 }
 
 
-def parse_notes(notes: str) -> dict:
+# Compiled once at import - parse_notes runs for every notes cell in the sheet
+_COMPILED_PATTERNS = {
+    key: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for key, patterns in PATTERNS.items()
+}
+
+# All follow-up tracking patterns in one alternation; a miss here means none
+# of the individual removals below can change the text
+_FOLLOWUP_TRACKING_RE = re.compile('|'.join(PATTERNS['followup_tracking']), re.IGNORECASE)
+
+# IGNORECASE matches both of these against 'i', but casefold() leaves dotless
+# i alone and turns dotted capital I into two characters
+_I_VARIANTS = str.maketrans({'\u0130': 'i', '\u0131': 'i'})
+
+# Lowercase literals, one of which appears in any text a pattern can match
+# (keep in sync with PATTERNS); cells containing none of them skip the scan
+_NOTES_KEYWORDS = ('respon', 'dm sent', 'messaged', 'follow', 'wrong', 'intro sent', 'skipped')
+
+# Twitter status checks, in priority order
+_TWITTER_STATUS_KEYS = (
+    ('dm_sent', 'messaged'),
+    ('followed', 'followed'),
+    ('wrong_twitter', 'wrong'),
+)
+
+# Cleanup for the leftover notes text: semicolons become spaces before
+# whitespace runs are collapsed
+_SEMICOLON_TO_SPACE = str.maketrans(';', ' ')
+_ALNUM_RE = re.compile(r'[a-zA-Z0-9]')
+
+
+@lru_cache(maxsize=4096)
+def parse_notes(notes: str) -> tuple:
     """
     Parse notes and extract structured data.
 
+    Cached by raw cell text: blank and templated notes repeat across rows.
+
     Returns:
-        dict with keys: responded, twitter_status, remaining_notes
+        (responded, twitter_status, remaining_notes) tuple
     """
     if not notes:
-        return {'responded': '', 'twitter_status': '', 'remaining_notes': ''}
-
-    result = {
-        'responded': '',
-        'twitter_status': '',
-        'remaining_notes': notes
-    }
-
-    # Check for responded
-    for pattern in PATTERNS['responded']:
-        match = re.search(pattern, notes, re.IGNORECASE)
-        if match:
-            date = match.group(1) if match.lastindex else ''
-            result['responded'] = date if date else 'yes'
-            # Remove from notes
-            result['remaining_notes'] = re.sub(pattern, '', result['remaining_notes'], flags=re.IGNORECASE)
-            break
-
-    # Check for DM sent (twitter_status = messaged)
-    if not result['twitter_status']:
-        for pattern in PATTERNS['dm_sent']:
-            match = re.search(pattern, notes, re.IGNORECASE)
+        return ('', '', '')
+
+    responded = ''
+    twitter_status = ''
+    remaining_notes = notes
+
+    # Cells without any pattern keyword can't match; casefold (with both
+    # Turkish i's mapped to 'i') sees the same letters IGNORECASE does
+    if notes.isascii():
+        folded = notes.lower()
+    else:
+        folded = notes.translate(_I_VARIANTS).casefold()
+
+    # Each category is detected against the original notes, and its first
+    # pattern (in PATTERNS order) that hits is cut from whatever text the
+    # earlier categories left. Patterns can overlap (a Wrong Twitter URL
+    # running into the next keyword, "Twitter wrong Twitter wrong"), so they
+    # are applied one at a time rather than as a single fused scan.
+    if any(keyword in folded for keyword in _NOTES_KEYWORDS):
+        # Check for responded
+        for regex in _COMPILED_PATTERNS['responded']:
+            match = regex.search(notes)
             if match:
-                result['twitter_status'] = 'messaged'
-                result['remaining_notes'] = re.sub(pattern, '', result['remaining_notes'], flags=re.IGNORECASE)
+                date = match.group(1) if match.lastindex else ''
+                responded = date if date else 'yes'
+                remaining_notes = regex.sub('', remaining_notes)
                 break
 
-    # Check for followed only
-    if not result['twitter_status']:
-        for pattern in PATTERNS['followed']:
-            if re.search(pattern, notes, re.IGNORECASE):
-                result['twitter_status'] = 'followed'
-                result['remaining_notes'] = re.sub(pattern, '', result['remaining_notes'], flags=re.IGNORECASE)
+        # Check for DM sent, then followed only, then wrong twitter
+        for key, status in _TWITTER_STATUS_KEYS:
+            regex = next((r for r in _COMPILED_PATTERNS[key] if r.search(notes)), None)
+            if regex:
+                twitter_status = status
+                remaining_notes = regex.sub('', remaining_notes)
                 break
 
-    # Check for wrong twitter
-    if not result['twitter_status']:
-        for pattern in PATTERNS['wrong_twitter']:
-            if re.search(pattern, notes, re.IGNORECASE):
-                result['twitter_status'] = 'wrong'
-                result['remaining_notes'] = re.sub(pattern, '', result['remaining_notes'], flags=re.IGNORECASE)
-                break
-
-    # Remove follow-up tracking (no longer needed)
-    for pattern in PATTERNS['followup_tracking']:
-        result['remaining_notes'] = re.sub(pattern, '', result['remaining_notes'], flags=re.IGNORECASE)
+        # Remove follow-up tracking (no longer needed). Still one pass per
+        # pattern, since cutting one can join text into a match for the next
+        if _FOLLOWUP_TRACKING_RE.search(remaining_notes):
+            for regex in _COMPILED_PATTERNS['followup_tracking']:
+                remaining_notes = regex.sub('', remaining_notes)
 
     # Clean up remaining notes
-    # Remove extra semicolons and whitespace
-    result['remaining_notes'] = re.sub(r'[;\s]+', ' ', result['remaining_notes']).strip()
-    result['remaining_notes'] = re.sub(r'\s+', ' ', result['remaining_notes']).strip()
+    # Remove extra semicolons and whitespace (split() drops leading/trailing runs)
+    remaining_notes = ' '.join(remaining_notes.translate(_SEMICOLON_TO_SPACE).split())
 
     # If only punctuation left, clear it
-    if result['remaining_notes'] and not re.search(r'[a-zA-Z0-9]', result['remaining_notes']):
-        result['remaining_notes'] = ''
+    if remaining_notes and not _ALNUM_RE.search(remaining_notes):
+        remaining_notes = ''
 
-    return result
+    return (responded, twitter_status, remaining_notes)
 
 
 def migrate_sheet(dry_run: bool = True):
@@ -178,13 +212,20 @@ def migrate_sheet(dry_run: bool = True):
                            'RC Responded', 'OL Responded', 'RC Twitter Status', 'OL Twitter Status',
                            'RC Email Status', 'OL Email Status']
 
-    # Normalize headers (strip whitespace)
-    normalized_headers = [h.strip().lower() if h else '' for h in headers]
-
-    missing_headers = []
-    for h in expected_new_headers:
-        if h.lower() not in normalized_headers:
-            missing_headers.append(h)
+    # One pass over the headers (stripped, lowercased): first index of each
+    # header, and the first column whose header contains each name we read
+    source_names = ('rc notes', 'ol notes', 'school')
+    header_index = {}
+    source_cols = {}
+    for i, h in enumerate(headers):
+        if h:
+            key = h.strip().lower()
+            header_index.setdefault(key, i)
+            for name in source_names:
+                if name in key:
+                    source_cols.setdefault(name, i)
+
+    missing_headers = [h for h in expected_new_headers if h.lower() not in header_index]
 
     if missing_headers:
         print(f"WARNING: Missing headers in sheet: {missing_headers}")
@@ -196,16 +237,9 @@ def migrate_sheet(dry_run: bool = True):
             print("Aborting. Add the headers and run again.")
             return False
 
-    # Find column indices (strip whitespace for matching)
-    def find_col(name):
-        for i, h in enumerate(headers):
-            if h and name.lower() in h.strip().lower():
-                return i
-        return -1
-
-    rc_notes_col = find_col('rc notes')
-    ol_notes_col = find_col('ol notes')
-    school_col = find_col('school')
+    rc_notes_col = source_cols.get('rc notes', -1)
+    ol_notes_col = source_cols.get('ol notes', -1)
+    school_col = source_cols.get('school', -1)
 
     # New columns (1-indexed for gspread)
     rc_responded_col = NEW_COLUMNS['rc_responded'] + 1
@@ -219,53 +253,56 @@ def migrate_sheet(dry_run: bool = True):
     print(f"OL Notes column: {ol_notes_col} (0-indexed)")
     print()
 
+    # Pad every row to one width so the loop indexes without bounds checks.
+    # The last column is always padding, so a column that wasn't found
+    # reads as blank from there.
+    width = max(len(r) for r in data) + 1
+    blank_col = width - 1
+    rows = [row + [''] * (width - len(row)) for row in rows]
+    school_read = school_col if school_col >= 0 else blank_col
+    rc_notes_read = rc_notes_col if rc_notes_col >= 0 else blank_col
+    ol_notes_read = ol_notes_col if ol_notes_col >= 0 else blank_col
+
     # Process each row
     changes = []
-    stats = {
-        'rc_responded': 0,
-        'ol_responded': 0,
-        'rc_twitter_messaged': 0,
-        'ol_twitter_messaged': 0,
-        'rc_twitter_followed': 0,
-        'ol_twitter_followed': 0,
-        'rc_twitter_wrong': 0,
-        'ol_twitter_wrong': 0,
-        'notes_cleaned': 0,
-    }
+    stats = Counter()
+    # Stats key for each twitter status, built once instead of per row
+    rc_twitter_stat = {status: f'rc_twitter_{status}' for _, status in _TWITTER_STATUS_KEYS}
+    ol_twitter_stat = {status: f'ol_twitter_{status}' for _, status in _TWITTER_STATUS_KEYS}
 
     for row_idx, row in enumerate(rows):
         row_num = row_idx + 2  # 1-indexed, skip header
-        school = row[school_col] if school_col >= 0 and school_col < len(row) else f'Row {row_num}'
+        school = row[school_read] or f'Row {row_num}'
 
-        rc_notes = row[rc_notes_col] if rc_notes_col >= 0 and rc_notes_col < len(row) else ''
-        ol_notes = row[ol_notes_col] if ol_notes_col >= 0 and ol_notes_col < len(row) else ''
+        rc_notes = row[rc_notes_read]
+        ol_notes = row[ol_notes_read]
 
         row_changes = []
 
         # Parse RC notes
         if rc_notes:
-            parsed = parse_notes(rc_notes)
-            if parsed['responded']:
-                row_changes.append(('RC Responded', rc_responded_col, parsed['responded']))
+            responded, twitter_status, remaining_notes = parse_notes(rc_notes)
+            if responded:
+                row_changes.append(('RC Responded', rc_responded_col, responded))
                 stats['rc_responded'] += 1
-            if parsed['twitter_status']:
-                row_changes.append(('RC Twitter Status', rc_twitter_col, parsed['twitter_status']))
-                stats[f'rc_twitter_{parsed["twitter_status"]}'] = stats.get(f'rc_twitter_{parsed["twitter_status"]}', 0) + 1
-            if parsed['remaining_notes'] != rc_notes:
-                row_changes.append(('RC Notes', rc_notes_col_write, parsed['remaining_notes']))
+            if twitter_status:
+                row_changes.append(('RC Twitter Status', rc_twitter_col, twitter_status))
+                stats[rc_twitter_stat[twitter_status]] += 1
+            if remaining_notes != rc_notes:
+                row_changes.append(('RC Notes', rc_notes_col_write, remaining_notes))
                 stats['notes_cleaned'] += 1
 
         # Parse OL notes
         if ol_notes:
-            parsed = parse_notes(ol_notes)
-            if parsed['responded']:
-                row_changes.append(('OL Responded', ol_responded_col, parsed['responded']))
+            responded, twitter_status, remaining_notes = parse_notes(ol_notes)
+            if responded:
+                row_changes.append(('OL Responded', ol_responded_col, responded))
                 stats['ol_responded'] += 1
-            if parsed['twitter_status']:
-                row_changes.append(('OL Twitter Status', ol_twitter_col, parsed['twitter_status']))
-                stats[f'ol_twitter_{parsed["twitter_status"]}'] = stats.get(f'ol_twitter_{parsed["twitter_status"]}', 0) + 1
-            if parsed['remaining_notes'] != ol_notes:
-                row_changes.append(('OL Notes', ol_notes_col_write, parsed['remaining_notes']))
+            if twitter_status:
+                row_changes.append(('OL Twitter Status', ol_twitter_col, twitter_status))
+                stats[ol_twitter_stat[twitter_status]] += 1
+            if remaining_notes != ol_notes:
+                row_changes.append(('OL Notes', ol_notes_col_write, remaining_notes))
                 stats['notes_cleaned'] += 1
 
         if row_changes:
@@ -277,12 +314,12 @@ def migrate_sheet(dry_run: bool = True):
     print("=" * 60)
     print(f"RC Responded found: {stats['rc_responded']}")
     print(f"OL Responded found: {stats['ol_responded']}")
-    print(f"RC Twitter 'messaged': {stats.get('rc_twitter_messaged', 0)}")
-    print(f"OL Twitter 'messaged': {stats.get('ol_twitter_messaged', 0)}")
-    print(f"RC Twitter 'followed': {stats.get('rc_twitter_followed', 0)}")
-    print(f"OL Twitter 'followed': {stats.get('ol_twitter_followed', 0)}")
-    print(f"RC Twitter 'wrong': {stats.get('rc_twitter_wrong', 0)}")
-    print(f"OL Twitter 'wrong': {stats.get('ol_twitter_wrong', 0)}")
+    print(f"RC Twitter 'messaged': {stats['rc_twitter_messaged']}")
+    print(f"OL Twitter 'messaged': {stats['ol_twitter_messaged']}")
+    print(f"RC Twitter 'followed': {stats['rc_twitter_followed']}")
+    print(f"OL Twitter 'followed': {stats['ol_twitter_followed']}")
+    print(f"RC Twitter 'wrong': {stats['rc_twitter_wrong']}")
+    print(f"OL Twitter 'wrong': {stats['ol_twitter_wrong']}")
     print(f"Notes to clean: {stats['notes_cleaned']}")
     print(f"Total rows with changes: {len(changes)}")
     print()
@@ -301,29 +338,40 @@ def migrate_sheet(dry_run: bool = True):
         print("Run with --live to apply changes")
         return True
 
-    # Apply changes with rate limiting
-    print("APPLYING CHANGES (with rate limiting)...")
+    # Apply changes in batches (one API write per WRITE_BATCH_SIZE cells)
+    from gspread.utils import rowcol_to_a1
+
+    print("APPLYING CHANGES (batched)...")
     applied = 0
     errors = 0
 
-    for row_num, school, row_changes in changes:
-        for col_name, col_idx, value in row_changes:
-            try:
-                manager._sheet.update_cell(row_num, col_idx, value)
-                applied += 1
-                # Rate limit: ~50 writes per minute to stay under 60/min limit
-                time.sleep(1.2)
-            except Exception as e:
-                print(f"  ERROR row {row_num} {col_name}: {e}")
-                errors += 1
-                # If rate limited, wait longer
-                if '429' in str(e):
-                    print("  Rate limited, waiting 60 seconds...")
-                    time.sleep(60)
+    # Built lazily, one batch at a time, rather than as a second full copy
+    # of every change
+    updates = (
+        {'range': rowcol_to_a1(row_num, col_idx), 'values': [[value]]}
+        for row_num, school, row_changes in changes
+        for col_name, col_idx, value in row_changes
+    )
+
+    # Rate limits back off exponentially (4s, 8s, ... about 2 minutes in all)
+    write_batch = retry_on_error(max_retries=5, delay=4.0)(manager._sheet.batch_update)
+
+    while True:
+        batch = list(islice(updates, WRITE_BATCH_SIZE))
+        if not batch:
+            break
+        try:
+            write_batch(batch, value_input_option='USER_ENTERED')
+            applied += len(batch)
+        except Exception as e:
+            print(f"  ERROR cells {batch[0]['range']}..{batch[-1]['range']}: {e}")
+            errors += len(batch)
 
         # Progress
-        if applied % 20 == 0:
-            print(f"  Applied {applied} changes...")
+        print(f"  Applied {applied} changes...")
+
+    # Written behind the manager's back, so its cached copy is stale
+    manager.invalidate_cache()
 
     print()
     print(f"DONE! Applied {applied} changes, {errors} errors")
@@ -10,17 +10,20 @@ Version: 2.3.0
 """
 
 import os
+import re
 import time
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from functools import wraps
+from itertools import repeat
 
 try:
     import gspread
     from gspread import Worksheet, Spreadsheet
     from gspread.exceptions import GSpreadException, APIError, SpreadsheetNotFound
+    from gspread.utils import rowcol_to_a1
     HAS_GSPREAD = True
 except ImportError:
     HAS_GSPREAD = False
@@ -40,8 +43,10 @@ except ImportError:
 # Import types
 try:
     from core.types import SchoolRecord, StaffMember, ExtractionResult, ProcessingStatus
+    HAS_TYPES = True
 except ImportError:
     # Fallback if core not available
+    HAS_TYPES = False
     SchoolRecord = dict
     StaffMember = dict
     ExtractionResult = dict
@@ -65,6 +70,10 @@ class SheetsConfig:
     min_request_delay: float = 0.5
     max_retries: int = 5
     
+    # Seconds get_all_data() may serve a cached copy (0 disables);
+    # any write through the manager invalidates it
+    data_cache_ttl: float = 30.0
+    
     # Column mappings (0-indexed)
     column_map: Dict[str, int] = field(default_factory=lambda: {
         'school': 0,
@@ -105,6 +114,22 @@ DEFAULT_HEADERS = [
     'RC Email Status', 'OL Email Status',
 ]
 
+# Low-confidence names are saved as "REVIEW: Name (NN%)" placeholders
+REVIEW_PREFIX = 'REVIEW:'
+
+# OAuth scopes for google-auth and for the oauth2client fallback
+_SCOPES = (
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive',
+)
+_SCOPES_OAUTH2CLIENT = (
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive',
+)
+
+# A spreadsheet key (as opposed to a spreadsheet name)
+_SHEET_ID_RE = re.compile(r'[A-Za-z0-9_-]{21,}')
+
 
 # ============================================================================
 # DECORATORS
@@ -179,6 +204,13 @@ class SheetsManager:
         self._reads = 0
         self._writes = 0
         self._errors = 0
+        
+        # (time.monotonic() fetched, rows) from the last get_all_data()
+        self._cached_data = None
+    
+    def invalidate_cache(self):
+        """Drop the cached sheet data so the next read re-fetches it."""
+        self._cached_data = None
     
     def connect(self) -> bool:
         """Connect to Google Sheets."""
@@ -224,18 +256,10 @@ class SheetsManager:
                     return False
                 
                 if USE_GOOGLE_AUTH:
-                    scopes = [
-                        'https://www.googleapis.com/auth/spreadsheets',
-                        'https://www.googleapis.com/auth/drive'
-                    ]
-                    creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
+                    creds = Credentials.from_service_account_info(creds_dict, scopes=_SCOPES)
                 elif USE_GOOGLE_AUTH is False:
                     from oauth2client.service_account import ServiceAccountCredentials
-                    scope = [
-                        'https://spreadsheets.google.com/feeds',
-                        'https://www.googleapis.com/auth/drive'
-                    ]
-                    creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
+                    creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, _SCOPES_OAUTH2CLIENT)
                 else:
                     self._connection_error = "No auth library installed"
                     return False
@@ -245,20 +269,12 @@ class SheetsManager:
             elif os.path.exists(self.config.credentials_file):
                 # Fall back to file (for local development)
                 if USE_GOOGLE_AUTH:
-                    scopes = [
-                        'https://www.googleapis.com/auth/spreadsheets',
-                        'https://www.googleapis.com/auth/drive'
-                    ]
                     creds = Credentials.from_service_account_file(
-                        self.config.credentials_file, scopes=scopes
+                        self.config.credentials_file, scopes=_SCOPES
                     )
                 elif USE_GOOGLE_AUTH is False:
-                    scope = [
-                        'https://spreadsheets.google.com/feeds',
-                        'https://www.googleapis.com/auth/drive'
-                    ]
                     creds = ServiceAccountCredentials.from_json_keyfile_name(
-                        self.config.credentials_file, scope
+                        self.config.credentials_file, _SCOPES_OAUTH2CLIENT
                     )
                 else:
                     self._connection_error = "No auth library installed. Run: pip install google-auth"
@@ -276,13 +292,7 @@ class SheetsManager:
             sheet_identifier = self.config.spreadsheet_name
             
             # Check if it looks like a Sheet ID
-            is_sheet_id = (
-                len(sheet_identifier) > 20 and 
-                all(c.isalnum() or c in '-_' for c in sheet_identifier) and
-                ' ' not in sheet_identifier
-            )
-            
-            if is_sheet_id:
+            if _SHEET_ID_RE.fullmatch(sheet_identifier):
                 logger.info(f"Opening sheet by ID: {sheet_identifier[:20]}...")
                 self._spreadsheet = self._client.open_by_key(sheet_identifier)
             else:
@@ -290,6 +300,7 @@ class SheetsManager:
                 self._spreadsheet = self._client.open(sheet_identifier)
             
             self._sheet = self._spreadsheet.sheet1
+            self._cached_data = None
             self._connected = True
             self._connection_error = None
             
@@ -310,6 +321,7 @@ class SheetsManager:
         self._sheet = None
         self._spreadsheet = None
         self._client = None
+        self._cached_data = None
         self._connected = False
         logger.info("Disconnected from sheets")
     
@@ -325,21 +337,128 @@ class SheetsManager:
     # READ OPERATIONS
     # =========================================================================
     
-    @retry_on_error(max_retries=3)
-    @rate_limited(min_delay=0.5)
     def get_all_data(self) -> List[List[str]]:
-        """Get all data from sheet."""
+        """
+        Get all data from sheet.
+        
+        Back-to-back calls within config.data_cache_ttl seconds share one
+        get_all_values round-trip. Rows are shared with the cache, so treat
+        them as read-only.
+        """
         if not self._sheet:
             return []
+        data = self._fresh_cached_data()
+        if data is not None:
+            return list(data)
+        return self._fetch_all_values()
+    
+    def _fresh_cached_data(self) -> Optional[List[List[str]]]:
+        """The cached get_all_data rows, or None if missing or expired."""
+        if self._cached_data is None:
+            return None
+        fetched, data = self._cached_data
+        if time.monotonic() - fetched < self.config.data_cache_ttl:
+            return data
+        return None
+    
+    # Only the _fetch_* methods are rate limited: cache hits in get_all_data,
+    # get_columns and _get_row return without waiting out the delay
+    @retry_on_error(max_retries=3)
+    @rate_limited(min_delay=0.5)
+    def _fetch_all_values(self) -> List[List[str]]:
+        """Fetch the whole sheet and refresh the cache."""
         try:
             data = self._sheet.get_all_values()
             self._reads += 1
-            return data
+            self._cached_data = (time.monotonic(), data)
+            return list(data)
         except Exception as e:
             logger.error(f"Failed to get data: {e}")
             self._errors += 1
             return []
     
+    def get_columns(self, col_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Get only the named columns, header row included.
+        
+        One values.batchGet request for just these columns instead of the
+        whole sheet (served from the get_all_data cache while it is fresh).
+        Every list is padded to the same length, so index i is sheet row
+        i + 1 in each; unmapped columns come back blank.
+        """
+        if not self._sheet:
+            return {}
+        indices = {name: self.get_col_index(name) for name in col_names}
+        
+        data = self._fresh_cached_data()
+        if data is not None:
+            return {
+                name: [row[idx] if 0 <= idx < len(row) else '' for row in data]
+                for name, idx in indices.items()
+            }
+        
+        columns = self._fetch_columns([idx for idx in indices.values() if idx >= 0])
+        if columns is None:
+            return {}
+        height = max((len(values) for values in columns.values()), default=0)
+        return {
+            name: columns.get(idx, []) + [''] * (height - len(columns.get(idx, [])))
+            for name, idx in indices.items()
+        }
+    
+    def _get_row(self, row_index: int) -> List[str]:
+        """
+        Get one row (1-indexed) without fetching the whole sheet.
+        
+        Served from the get_all_data cache while it is fresh; [] for a
+        blank or missing row.
+        """
+        if not self._sheet:
+            return []
+        data = self._fresh_cached_data()
+        if data is not None:
+            row = data[row_index - 1] if 0 < row_index <= len(data) else []
+            return row if any(row) else []
+        return self._fetch_row(row_index)
+    
+    @retry_on_error(max_retries=3)
+    @rate_limited(min_delay=0.5)
+    def _fetch_row(self, row_index: int) -> List[str]:
+        """Fetch one row (1-indexed) with a single row_values request."""
+        try:
+            row = self._sheet.row_values(row_index)
+            self._reads += 1
+            return row
+        except Exception as e:
+            logger.error(f"Failed to get row {row_index}: {e}")
+            self._errors += 1
+            return []
+    
+    @retry_on_error(max_retries=3)
+    @rate_limited(min_delay=0.5)
+    def _fetch_columns(self, col_indices: List[int]) -> Optional[Dict[int, List[str]]]:
+        """Fetch whole columns (0-indexed) by index; None on failure."""
+        if not col_indices:
+            return {}
+        title = self._sheet.title.replace("'", "''")
+        letters = [rowcol_to_a1(1, idx + 1)[:-1] for idx in col_indices]
+        try:
+            response = self._spreadsheet.values_batch_get(
+                [f"'{title}'!{letter}:{letter}" for letter in letters],
+                params={'majorDimension': 'COLUMNS'},
+            )
+            self._reads += 1
+        except Exception as e:
+            logger.error(f"Failed to get columns {letters}: {e}")
+            self._errors += 1
+            return None
+        
+        # Blank columns come back without 'values'
+        return {
+            idx: (value_range.get('values') or [[]])[0]
+            for idx, value_range in zip(col_indices, response.get('valueRanges', []))
+        }
+    
     def get_schools_to_process(self, reverse: bool = False) -> List:
         """
         Get schools that need processing.
@@ -347,24 +466,21 @@ class SheetsManager:
         Args:
             reverse: If True, start from bottom of sheet (newest schools first)
         """
-        data = self.get_all_data()
+        columns = self.get_columns(['school', 'url', 'rc_name', 'ol_name'])
+        data = list(zip(*columns.values()))
         if len(data) < 2:
             logger.info("No data in sheet")
             return []
         
-        headers = data[0]
         rows = data[1:]
         
         logger.info(f"Found {len(rows)} total rows in sheet")
         
         schools = []
-        for row_idx, row in enumerate(rows):
+        for row_idx, (school, url, rc_name, ol_name) in enumerate(rows):
             row_num = row_idx + 2  # 1-indexed + header
             
-            school = self._safe_get(row, self.get_col_index('school'))
-            url = self._safe_get(row, self.get_col_index('url'))
-            rc_name = self._safe_get(row, self.get_col_index('rc_name'))
-            ol_name = self._safe_get(row, self.get_col_index('ol_name'))
+            url = url.strip()
             
             if not url or not url.startswith('http'):
                 continue
@@ -373,30 +489,31 @@ class SheetsManager:
             # - Empty = needs processing
             # - "REVIEW:..." = needs re-processing (low confidence)
             # - Any other value = already done
-            rc_done = rc_name and not rc_name.startswith('REVIEW:')
-            ol_done = ol_name and not ol_name.startswith('REVIEW:')
+            rc_name = rc_name.strip()
+            ol_name = ol_name.strip()
+            rc_done = rc_name and not rc_name.startswith(REVIEW_PREFIX)
+            ol_done = ol_name and not ol_name.startswith(REVIEW_PREFIX)
             
             # Skip if both already done
             if rc_done and ol_done:
                 continue
             
             # Create SchoolRecord with empty names so needs_rc/needs_ol properties work
-            try:
-                from core.types import SchoolRecord, ProcessingStatus
+            if HAS_TYPES:
                 record = SchoolRecord(
                     row_index=row_num,
-                    school_name=school,
+                    school_name=school.strip(),
                     staff_url=url,
                     rc_name=rc_name if rc_done else "",  # Empty if needs processing
                     ol_name=ol_name if ol_done else "",  # Empty if needs processing
                     status=ProcessingStatus.NOT_PROCESSED
                 )
                 schools.append(record)
-            except ImportError:
+            else:
                 # Fallback to dict if types not available
                 schools.append({
                     'row_index': row_num,
-                    'school_name': school,
+                    'school_name': school.strip(),
                     'staff_url': url,
                     'needs_rc': not rc_done,
                     'needs_ol': not ol_done,
@@ -416,6 +533,36 @@ class SheetsManager:
             return default
         return str(row[idx]).strip() if row[idx] else default
     
+    @staticmethod
+    def _parse_date(value: str) -> Optional[date]:
+        """
+        Parse an M/D/YYYY sheet date; None if it isn't one.
+        
+        Accepts what strptime('%m/%d/%Y') does for these columns, without
+        its per-call format handling.
+        """
+        parts = value.split('/')
+        if len(parts) != 3:
+            return None
+        month, day, year = parts
+        if len(day) == 2 and day[0] == ' ':
+            day = day[1]  # %d also takes a space-padded day
+        digits = month + day + year
+        if not (0 < len(month) <= 2 and 0 < len(day) <= 2 and len(year) == 4
+                and digits.isascii() and digits.isdigit()):
+            return None
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            return None
+    
+    def _column_values(self, rows: List[List], idx: int) -> List[str]:
+        """Non-blank, stripped values of one column (short rows are skipped)."""
+        if idx < 0:
+            return []
+        values = (row[idx].strip() for row in rows if idx < len(row))
+        return [v for v in values if v]
+    
     # =========================================================================
     # WRITE OPERATIONS
     # =========================================================================
@@ -426,6 +573,7 @@ class SheetsManager:
         """Update a single cell."""
         if not self._sheet:
             return False
+        self.invalidate_cache()
         try:
             self._sheet.update_cell(row, col, value)
             self._writes += 1
@@ -435,35 +583,82 @@ class SheetsManager:
             self._errors += 1
             return False
     
+    @retry_on_error(max_retries=3)
+    @rate_limited(min_delay=0.5)
+    def _batch_update_cells(self, updates: List[Tuple[int, int, str]]) -> bool:
+        """
+        Update several cells in one values.batchUpdate request.
+        
+        One API call (and one write against the per-minute quota)
+        instead of one update_cell call per cell. Adjacent cells in a row
+        go out as a single range.
+        
+        Args:
+            updates: (row, col, value) tuples, 1-indexed
+        
+        Returns:
+            True if successful
+        """
+        if not updates:
+            return True
+        if not self._sheet:
+            return False
+        # Later updates to the same cell win, as they would one at a time
+        cells = {(row, col): value for row, col, value in updates}
+        
+        # Merge runs of adjacent columns into (row, first col, values)
+        runs = []
+        for (row, col), value in sorted(cells.items()):
+            if runs and runs[-1][0] == row and runs[-1][1] + len(runs[-1][2]) == col:
+                runs[-1][2].append(value)
+            else:
+                runs.append((row, col, [value]))
+        
+        self.invalidate_cache()
+        try:
+            self._sheet.batch_update(
+                [{'range': rowcol_to_a1(row, col) if len(values) == 1
+                  else f"{rowcol_to_a1(row, col)}:{rowcol_to_a1(row, col + len(values) - 1)}",
+                  'values': [values]}
+                 for row, col, values in runs],
+                value_input_option='USER_ENTERED',  # same as update_cell
+            )
+            self._writes += 1
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update cells {[(r, c) for r, c, _ in updates]}: {e}")
+            self._errors += 1
+            return False
+    
     def update_rc(self, row_index: int, name: str, email: str = None) -> bool:
         """Update RC name and optionally email."""
-        success = True
+        updates = []
         
         col = self.get_col_index('rc_name') + 1  # 1-indexed
         if col > 0:
-            success &= self.update_cell(row_index, col, name)
+            updates.append((row_index, col, name))
         
         if email:
             col = self.get_col_index('rc_email') + 1
             if col > 0:
-                success &= self.update_cell(row_index, col, email)
+                updates.append((row_index, col, email))
         
-        return success
+        return self._batch_update_cells(updates)
     
     def update_ol(self, row_index: int, name: str, email: str = None) -> bool:
         """Update OL name and optionally email."""
-        success = True
+        updates = []
 
         col = self.get_col_index('ol_name') + 1  # 1-indexed
         if col > 0:
-            success &= self.update_cell(row_index, col, name)
+            updates.append((row_index, col, name))
 
         if email:
             col = self.get_col_index('ol_email') + 1
             if col > 0:
-                success &= self.update_cell(row_index, col, email)
+                updates.append((row_index, col, email))
 
-        return success
+        return self._batch_update_cells(updates)
 
     @retry_on_error(max_retries=3)
     @rate_limited(min_delay=0.5)
@@ -479,6 +674,7 @@ class SheetsManager:
         """
         if not self._sheet:
             return False
+        self.invalidate_cache()
         try:
             self._sheet.delete_rows(row_index)
             self._writes += 1
@@ -489,6 +685,54 @@ class SheetsManager:
             self._errors += 1
             return False
 
+    @retry_on_error(max_retries=3)
+    @rate_limited(min_delay=0.5)
+    def delete_rows_batch(self, row_indices: List[int]) -> bool:
+        """
+        Delete several rows in one spreadsheets.batchUpdate request.
+
+        Args:
+            row_indices: Row numbers (1-indexed), in any order
+
+        Returns:
+            True if successful
+        """
+        if not row_indices:
+            return True
+        if not self._sheet:
+            return False
+
+        # Merge runs of adjacent rows into (first, last) ranges, bottom-up so
+        # each deleteDimension leaves the indices of the next one untouched
+        ranges = []
+        for row_index in sorted(set(row_indices), reverse=True):
+            if ranges and ranges[-1][0] == row_index + 1:
+                ranges[-1][0] = row_index
+            else:
+                ranges.append([row_index, row_index])
+
+        requests = [{
+            'deleteDimension': {
+                'range': {
+                    'sheetId': self._sheet.id,
+                    'dimension': 'ROWS',
+                    'startIndex': first - 1,  # 0-indexed, end exclusive
+                    'endIndex': last,
+                }
+            }
+        } for first, last in ranges]
+
+        self.invalidate_cache()
+        try:
+            self._spreadsheet.batch_update({'requests': requests})
+            self._writes += 1
+            logger.info(f"Deleted {len(set(row_indices))} rows")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete rows {sorted(set(row_indices))}: {e}")
+            self._errors += 1
+            return False
+
     def update_email_status(self, row_index: int, coach_type: str, status: str) -> bool:
         """
         Update Email status for a coach.
@@ -531,8 +775,13 @@ class SheetsManager:
         Returns:
             True if successful
         """
-        success = True
+        return self._batch_update_cells(
+            self._followup_cells(row_index, coach_type, str(stage), next_contact)
+        )
 
+    def _followup_cells(self, row_index: int, coach_type: str, stage: str,
+                        next_contact: str) -> List[Tuple[int, int, str]]:
+        """(row, col, value) updates for a coach's stage and next-contact cells."""
         if coach_type == 'rc':
             stage_col = self.get_col_index('rc_followup_stage') + 1
             next_col = self.get_col_index('rc_next_contact') + 1
@@ -540,12 +789,12 @@ class SheetsManager:
             stage_col = self.get_col_index('ol_followup_stage') + 1
             next_col = self.get_col_index('ol_next_contact') + 1
 
+        updates = []
         if stage_col > 0:
-            success &= self.update_cell(row_index, stage_col, str(stage))
+            updates.append((row_index, stage_col, stage))
         if next_col > 0:
-            success &= self.update_cell(row_index, next_col, next_contact)
-
-        return success
+            updates.append((row_index, next_col, next_contact))
+        return updates
 
     def get_due_followups(self) -> List[Dict]:
         """
@@ -556,7 +805,11 @@ class SheetsManager:
         """
         from datetime import datetime
 
-        data = self.get_all_data()
+        columns = self.get_columns([
+            'school', 'rc_name', 'rc_email', 'rc_followup_stage', 'rc_next_contact',
+            'ol_name', 'ol_email', 'ol_followup_stage', 'ol_next_contact',
+        ])
+        data = list(zip(*columns.values()))
         if len(data) < 2:
             return []
 
@@ -564,26 +817,27 @@ class SheetsManager:
         today = datetime.now().date()
         due = []
 
-        for row_idx, row in enumerate(rows):
-            row_num = row_idx + 2
-            school = self._safe_get(row, self.get_col_index('school'))
+        # Rows hold just the requested columns, in order
+        for row_num, (school, rc_name, rc_email, rc_stage, rc_next,
+                      ol_name, ol_email, ol_stage, ol_next) in enumerate(rows, start=2):
+            school = school.strip()
 
             if not school:
                 continue
 
             # Check RC
-            rc_next = self._safe_get(row, self.get_col_index('rc_next_contact'))
+            rc_next = rc_next.strip()
             if rc_next:
                 try:
-                    rc_date = datetime.strptime(rc_next, '%m/%d/%Y').date()
-                    if rc_date <= today:
-                        rc_stage = int(self._safe_get(row, self.get_col_index('rc_followup_stage')) or '0')
+                    rc_date = self._parse_date(rc_next)
+                    if rc_date is not None and rc_date <= today:
+                        rc_stage = int(rc_stage.strip() or '0')
                         due.append({
                             'row_index': row_num,
                             'school': school,
                             'coach_type': 'rc',
-                            'name': self._safe_get(row, self.get_col_index('rc_name')),
-                            'email': self._safe_get(row, self.get_col_index('rc_email')),
+                            'name': rc_name.strip(),
+                            'email': rc_email.strip(),
                             'stage': rc_stage,
                             'is_restart': rc_stage >= 2,  # After stage 2, it's a restart
                             'next_contact': rc_next,
@@ -592,18 +846,18 @@ class SheetsManager:
                     pass
 
             # Check OL
-            ol_next = self._safe_get(row, self.get_col_index('ol_next_contact'))
+            ol_next = ol_next.strip()
             if ol_next:
                 try:
-                    ol_date = datetime.strptime(ol_next, '%m/%d/%Y').date()
-                    if ol_date <= today:
-                        ol_stage = int(self._safe_get(row, self.get_col_index('ol_followup_stage')) or '0')
+                    ol_date = self._parse_date(ol_next)
+                    if ol_date is not None and ol_date <= today:
+                        ol_stage = int(ol_stage.strip() or '0')
                         due.append({
                             'row_index': row_num,
                             'school': school,
                             'coach_type': 'ol',
-                            'name': self._safe_get(row, self.get_col_index('ol_name')),
-                            'email': self._safe_get(row, self.get_col_index('ol_email')),
+                            'name': ol_name.strip(),
+                            'email': ol_email.strip(),
                             'stage': ol_stage,
                             'is_restart': ol_stage >= 2,
                             'next_contact': ol_next,
@@ -639,12 +893,11 @@ class SheetsManager:
             contacted_col = self.get_col_index('ol_contacted') + 1
             stage_col = self.get_col_index('ol_followup_stage')
 
-        # Get current stage
-        data = self.get_all_data()
-        if row_index - 1 >= len(data):
+        # Get current stage (a blank or missing row has no coach to mark)
+        row = self._get_row(row_index)
+        if not row:
             return False
 
-        row = data[row_index - 1] if row_index <= len(data) else []
         current_stage = int(self._safe_get(row, stage_col) or '0')
 
         if is_intro:
@@ -660,29 +913,17 @@ class SheetsManager:
         if new_stage >= 2:
             new_stage = 2  # Cap at 2, next send will be restart
 
-        # Update sheet
-        success = True
-        success &= self.update_cell(row_index, contacted_col, today_str)
-        success &= self.update_followup(row_index, coach_type, new_stage, next_contact_str)
+        # Update sheet (contacted date + follow-up tracking in one request)
+        updates = []
+        if contacted_col > 0:
+            updates.append((row_index, contacted_col, today_str))
+        updates += self._followup_cells(row_index, coach_type, str(new_stage), next_contact_str)
 
-        return success
+        return self._batch_update_cells(updates)
 
     def clear_followup(self, row_index: int, coach_type: str) -> bool:
         """Clear follow-up tracking (e.g., when coach responds)."""
-        if coach_type == 'rc':
-            stage_col = self.get_col_index('rc_followup_stage') + 1
-            next_col = self.get_col_index('rc_next_contact') + 1
-        else:
-            stage_col = self.get_col_index('ol_followup_stage') + 1
-            next_col = self.get_col_index('ol_next_contact') + 1
-
-        success = True
-        if stage_col > 0:
-            success &= self.update_cell(row_index, stage_col, '')
-        if next_col > 0:
-            success &= self.update_cell(row_index, next_col, '')
-
-        return success
+        return self._batch_update_cells(self._followup_cells(row_index, coach_type, '', ''))
 
     def get_coaches_for_twitter(self) -> List[Dict]:
         """
@@ -697,25 +938,29 @@ class SheetsManager:
         Returns:
             List of dicts with coach info for Twitter messaging
         """
-        data = self.get_all_data()
+        columns = self.get_columns([
+            'school', 'rc_name', 'rc_twitter', 'rc_email', 'rc_responded', 'rc_twitter_status',
+            'ol_name', 'ol_twitter', 'ol_email', 'ol_responded', 'ol_twitter_status',
+        ])
+        data = list(zip(*columns.values()))
         if len(data) < 2:
             return []
 
-        headers = data[0]
         rows = data[1:]
         coaches = []
 
-        for row_idx, row in enumerate(rows):
-            row_num = row_idx + 2
-            school = self._safe_get(row, self.get_col_index('school'))
+        # Rows hold just the requested columns, in order
+        for row_num, (school, rc_name, rc_twitter, rc_email, rc_responded, rc_twitter_status,
+                      ol_name, ol_twitter, ol_email, ol_responded, ol_twitter_status) in enumerate(rows, start=2):
+            school = school.strip()
 
             if not school:
                 continue
 
             # Check RC
-            rc_twitter = self._safe_get(row, self.get_col_index('rc_twitter'))
-            rc_responded = self._safe_get(row, self.get_col_index('rc_responded'))
-            rc_twitter_status = self._safe_get(row, self.get_col_index('rc_twitter_status')).lower()
+            rc_twitter = rc_twitter.strip()
+            rc_responded = rc_responded.strip()
+            rc_twitter_status = rc_twitter_status.strip().lower()
 
             if rc_twitter and not rc_responded:
                 # Skip if already messaged, followed, or wrong
@@ -724,15 +969,15 @@ class SheetsManager:
                         'row_index': row_num,
                         'school': school,
                         'coach_type': 'rc',
-                        'name': self._safe_get(row, self.get_col_index('rc_name')),
+                        'name': rc_name.strip(),
                         'handle': rc_twitter,
-                        'email': self._safe_get(row, self.get_col_index('rc_email')),
+                        'email': rc_email.strip(),
                     })
 
             # Check OL
-            ol_twitter = self._safe_get(row, self.get_col_index('ol_twitter'))
-            ol_responded = self._safe_get(row, self.get_col_index('ol_responded'))
-            ol_twitter_status = self._safe_get(row, self.get_col_index('ol_twitter_status')).lower()
+            ol_twitter = ol_twitter.strip()
+            ol_responded = ol_responded.strip()
+            ol_twitter_status = ol_twitter_status.strip().lower()
 
             if ol_twitter and not ol_responded:
                 # Skip if already messaged, followed, or wrong
@@ -741,9 +986,9 @@ class SheetsManager:
                         'row_index': row_num,
                         'school': school,
                         'coach_type': 'ol',
-                        'name': self._safe_get(row, self.get_col_index('ol_name')),
+                        'name': ol_name.strip(),
                         'handle': ol_twitter,
-                        'email': self._safe_get(row, self.get_col_index('ol_email')),
+                        'email': ol_email.strip(),
                     })
 
         return coaches
@@ -792,9 +1037,10 @@ class SheetsManager:
             col = self.get_col_index('ol_responded') + 1
 
         if col > 0:
-            # Also clear follow-up tracking
-            self.clear_followup(row_index, coach_type)
-            return self.update_cell(row_index, col, date_str)
+            # Also clear follow-up tracking, in the same request
+            updates = self._followup_cells(row_index, coach_type, '', '')
+            updates.append((row_index, col, date_str))
+            return self._batch_update_cells(updates)
         return False
 
     def get_stats(self) -> Dict[str, int]:
@@ -813,42 +1059,20 @@ class SheetsManager:
             rc_twitter_col = self.get_col_index('rc_twitter')
             ol_twitter_col = self.get_col_index('ol_twitter')
             
-            total = len(rows)
-            rc_count = 0
-            ol_count = 0
-            rc_review = 0
-            ol_review = 0
-            emails = 0
-            twitter = 0
+            # Column-wise: one comprehension per column instead of six
+            # cell lookups per row
+            rc_vals = self._column_values(rows, rc_col)
+            ol_vals = self._column_values(rows, ol_col)
+            rc_review = sum(map(str.startswith, rc_vals, repeat(REVIEW_PREFIX)))
+            ol_review = sum(map(str.startswith, ol_vals, repeat(REVIEW_PREFIX)))
             
-            for row in rows:
-                # RC
-                rc_val = self._safe_get(row, rc_col)
-                if rc_val:
-                    if rc_val.startswith('REVIEW:'):
-                        rc_review += 1
-                    else:
-                        rc_count += 1
-                
-                # OL
-                ol_val = self._safe_get(row, ol_col)
-                if ol_val:
-                    if ol_val.startswith('REVIEW:'):
-                        ol_review += 1
-                    else:
-                        ol_count += 1
-                
-                # Emails
-                if self._safe_get(row, rc_email_col):
-                    emails += 1
-                if self._safe_get(row, ol_email_col):
-                    emails += 1
-                
-                # Twitter
-                if self._safe_get(row, rc_twitter_col):
-                    twitter += 1
-                if self._safe_get(row, ol_twitter_col):
-                    twitter += 1
+            total = len(rows)
+            rc_count = len(rc_vals) - rc_review
+            ol_count = len(ol_vals) - ol_review
+            emails = (len(self._column_values(rows, rc_email_col))
+                      + len(self._column_values(rows, ol_email_col)))
+            twitter = (len(self._column_values(rows, rc_twitter_col))
+                       + len(self._column_values(rows, ol_twitter_col)))
             
             return {
                 'total': total,